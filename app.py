@@ -1,10 +1,20 @@
 import os
 import json
+import bisect
+import heapq
+import functools
+import time
+import queue
+import atexit
 import logging
+import logging.handlers
+from itertools import chain
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import tkinter as tk
-from tkinter import ttk, messagebox
-from tkinter.scrolledtext import ScrolledText
+from tkinter import ttk
+import tkinter.font as tkFont
 from todo.models import Task
 from todo import storage
 from todo.utils import format_duration
@@ -18,8 +28,28 @@ ARCHIVE_PATH = os.path.join(BASE_DIR, "archive.json")
 FINISHED_PATH = os.path.join(BASE_DIR, "finished.json")
 LOG_PATH = os.path.join(BASE_DIR, "todo.log")
 
-logging.basicConfig(filename=LOG_PATH, level=logging.INFO,
-                    format="%(asctime)s %(levelname)s %(message)s")
+# Delay before a search/filter change re-renders the task list (ms)
+FILTER_DEBOUNCE_MS = 150
+# How long after a change dirty task files are written, coalescing bursts (ms)
+SAVE_DEBOUNCE_MS = 500
+# Height of the canvas-drawn archive/finished rows (px)
+HISTORY_ROW_HEIGHT = 52
+# How long a permanent delete can be undone before it is written (ms)
+UNDO_TIMEOUT_MS = 5000
+# How long an inline notice (e.g. a validation message) stays up (ms)
+FLASH_MS = 2500
+# Delay after startup before the reusable task windows are built (ms)
+PREBUILD_DELAY_MS = 1000
+
+# Log records are queued on the UI thread and written by a listener thread
+_log_file_handler = logging.FileHandler(LOG_PATH)
+_log_file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+_log_queue = queue.SimpleQueue()
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 # Color scheme
 APP_COLORS = {
@@ -44,6 +74,183 @@ PRIORITY_COLORS = {
     "archived": "#94a3b8"
 }
 
+PRIORITY_ICONS = {
+    "high": "🔴",
+    "medium": "🔵",
+    "low": "🟢",
+    "done": "✓"
+}
+
+# Display labels per priority, so cards and details don't re-case strings per bind
+PRIO_TITLE = {"high": "High", "medium": "Medium", "low": "Low"}
+PRIO_UPPER = {"high": "HIGH", "medium": "MEDIUM", "low": "LOW"}
+# Task editor menu label per priority, in menu order
+PRIO_LABELS = {p: f"{PRIORITY_ICONS[p]} {PRIO_TITLE[p]}" for p in ("high", "medium", "low")}
+
+# Filter menu labels -> task field values
+STATUS_MAP = {"🔄 All": "all", "📝 Pending": "pending", "✓ Done": "done"}
+# (the priority labels are shared with the task editor menu)
+PRIO_MAP = {"📊 All": "all", **{label: p for p, label in PRIO_LABELS.items()}}
+
+# ttk style name -> options, applied in order by TodoApp._setup_style
+_STYLE_SPEC = [
+    (".", {"font": ("Segoe UI", 10), "background": APP_COLORS["bg_main"]}),
+    ("TFrame", {"background": APP_COLORS["bg_main"]}),
+    ("Card.TFrame", {"background": APP_COLORS["bg_card"], "relief": "flat", "borderwidth": 0}),
+    ("Archive.TFrame", {"background": APP_COLORS["bg_card"], "relief": "flat", "borderwidth": 0}),
+    ("Finished.TFrame", {"background": APP_COLORS["bg_card"], "relief": "flat", "borderwidth": 0}),
+    ("Header.TLabel", {"font": ("Segoe UI", 20, "bold"),
+                       "foreground": APP_COLORS["text_primary"], "background": APP_COLORS["bg_card"]}),
+    ("Muted.TLabel", {"font": ("Segoe UI", 9),
+                      "foreground": APP_COLORS["text_secondary"], "background": APP_COLORS["bg_card"]}),
+    ("Archive.TLabel", {"font": ("Segoe UI", 9),
+                        "foreground": APP_COLORS["archive"], "background": APP_COLORS["bg_card"]}),
+    ("Finished.TLabel", {"font": ("Segoe UI", 9),
+                         "foreground": APP_COLORS["success"], "background": APP_COLORS["bg_card"]}),
+    ("TButton", {"font": ("Segoe UI", 10), "padding": (12, 6), "relief": "flat", "borderwidth": 1}),
+    ("Accent.TButton", {"font": ("Segoe UI", 10, "bold"), "padding": (12, 6),
+                        "background": APP_COLORS["accent"], "foreground": "white"}),
+    ("Success.TButton", {"background": APP_COLORS["success"], "foreground": "white"}),
+    ("Danger.TButton", {"background": APP_COLORS["error"], "foreground": "white"}),
+    ("Archive.TButton", {"background": APP_COLORS["archive"], "foreground": "white"}),
+    ("TEntry", {"fieldbackground": APP_COLORS["bg_card"], "borderwidth": 1, "relief": "solid"}),
+    ("Reopen.TButton", {"background": "#838b94", "foreground": "white"}),
+    # Task card badges; the per-priority styles below inherit from this one
+    ("Badge.TLabel", {"font": ("Segoe UI", 9, "bold"), "foreground": "white",
+                      "background": "#999999", "padding": (10, 4), "relief": "flat"}),
+]
+
+# Priority (or "done") -> badge style, so binding a card only switches style names
+BADGE_STYLES = {key: f"{key.title()}.Badge.TLabel" for key in PRIORITY_COLORS}
+_STYLE_SPEC += [(BADGE_STYLES[key], {"background": color}) for key, color in PRIORITY_COLORS.items()]
+
+
+@functools.lru_cache(maxsize=8192)
+def _elapsed_text(seconds):
+    """Timer label text; rows rebind the same values repeatedly while scrolling"""
+    return f"⏱ {format_duration(seconds)}"
+
+
+@functools.lru_cache(maxsize=None)
+def _card_view(status, priority):
+    """Badge text and style, title color and done button for a card state
+
+    These only depend on (status, priority), so each pair is worked out once.
+    """
+    if status == "done":
+        return (f"{PRIORITY_ICONS['done']} Completed", BADGE_STYLES["done"],
+                APP_COLORS["text_secondary"], "🔄 Reopen", "TButton")
+    icon = PRIORITY_ICONS.get(priority, "•")
+    return (f"{icon} {PRIO_TITLE.get(priority) or priority.title()}",
+            BADGE_STYLES.get(priority, "Badge.TLabel"),
+            APP_COLORS["text_primary"], "✓ Done", "Success.TButton")
+
+
+@functools.lru_cache(maxsize=8192)
+def _stamp_row(label, iso_text):
+    """History row timestamp text; the same stamps are rebound while scrolling"""
+    if not iso_text:
+        return ""
+    try:
+        stamp = datetime.fromisoformat(iso_text).strftime("%b %d, %Y %I:%M %p")
+    except (TypeError, ValueError):
+        # Fallback if date parsing fails
+        stamp = iso_text
+    return f"{label}: {stamp}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _long_stamp(iso_text):
+    """ISO timestamp -> "March 05, 2024 at 09:30 AM" for the details windows
+
+    Raises ValueError/TypeError for unparsable stamps (errors aren't cached).
+    """
+    return datetime.fromisoformat(iso_text).strftime("%B %d, %Y at %I:%M %p")
+
+
+# ---------- Sorted lists ---------- #
+# Archive and finished lists are kept in ascending order with these keys and
+# shown newest first, so they never need re-sorting on render.
+_archive_key = attrgetter("_archived_ts")
+_created_key = attrgetter("_created_ts")
+
+
+def _narrows(old, new):
+    """True if filter state new only matches a subset of what old matched
+
+    States are (status, priority, query) as returned by TodoApp._filter_state.
+    """
+    return (old[0] in ("all", new[0]) and old[1] in ("all", new[1])
+            and new[2].startswith(old[2]))
+
+
+def _newest_first_key(task):
+    """Ascending key for lists sorted newest first, for use with bisect"""
+    return -task._created_ts
+
+
+def _parse_ts(iso_text):
+    """ISO timestamp -> epoch seconds, parsed once and cached on the task"""
+    try:
+        return datetime.fromisoformat(iso_text).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _cache_created(task):
+    """Parse created_at once; sorting, rows and detail windows reuse the results"""
+    try:
+        created = datetime.fromisoformat(task.created_at)
+    except (TypeError, ValueError):
+        task._created_ts = 0.0
+        task._created_row = task.created_at.split("T", 1)[0]
+        task._created_long = None
+        return
+    task._created_ts = created.timestamp()
+    task._created_row = created.strftime("%Y-%m-%d %I:%M %p")
+    task._created_long = created.strftime("%B %d, %Y at %I:%M %p")
+
+
+def _truncate(text, max_length):
+    if len(text) <= max_length:
+        return text
+    return text[:max_length-1] + "…"
+
+
+def _cache_text_keys(task):
+    """Store lowercased and truncated title/description once per edit
+
+    Searching and row binding read these instead of redoing lower() and
+    truncation on every render and scroll.
+    """
+    # One haystack, so a search is a single substring test per task; the
+    # NUL separator keeps a match from spanning title and description
+    task._search_lc = f"{task.title}\0{task.description}".lower()
+    task._title_short = _truncate(task.title, 25)
+    task._title_row = _truncate(task.title, 40)
+    first_line = task.description.split("\n", 1)[0] if task.description else "(no description)"
+    task._desc_row = _truncate(first_line, 80)
+
+
+def _fingerprint(tasks):
+    """Hash of every persisted field, used to skip writing an unchanged list"""
+    return hash(tuple(
+        (t.id, t.title, t.description, t.status, t.priority, t.created_at,
+         t.due_date, t.duration_seconds, t.remaining_seconds, t.completed_at,
+         t.archived_at)
+        for t in tasks))
+
+
+def _remove_sorted(items, task, key):
+    """Remove task from a list kept sorted by key, locating it with bisect"""
+    k = key(task)
+    i = bisect.bisect_left(items, k, key=key)
+    while i < len(items) and key(items[i]) == k:
+        if items[i] is task:
+            del items[i]
+            return
+        i += 1
+
 
 # ---------- Modern Scrollbar ---------- #
 class ModernScrollbar(tk.Canvas):
@@ -200,8 +407,168 @@ class ModernScrollbar(tk.Canvas):
                 self.itemconfig('thumb', fill=self.thumb_color)
 
 
+# ---------- Virtual List ---------- #
+class VirtualList:
+    """Windowed list renderer for a canvas.
+
+    Only rows intersecting the viewport exist. Rows come from a small pool
+    built by ``make_row(canvas, tag)`` and are re-bound to other items with
+    ``bind_row`` as the view scrolls, instead of being destroyed and recreated.
+
+    A row is a dict. If it has a ``"frame"`` widget, the list embeds it with a
+    window item sized to the row; otherwise ``make_row`` draws canvas items
+    itself, tagged with ``tag`` and laid out from y=0. Items also tagged
+    ``"east"`` are drawn relative to the right edge (x <= 0) and stay aligned
+    to it when the canvas is resized.
+
+    The optional ``unbind_row(row)`` is called when a row is hidden, so
+    callers can drop per-item state (e.g. live labels) held for it.
+    """
+
+    def __init__(self, canvas, scrollbar, make_row, bind_row, row_height=None,
+                 empty_text="", empty_color=None, empty_font=None, buffer=2,
+                 unbind_row=None):
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self.make_row = make_row
+        self.bind_row = bind_row
+        self.unbind_row = unbind_row
+        self.buffer = buffer
+        self.items = []
+        self.reverse = False
+        self.row_height = row_height
+        self.width = 1
+        self.height = 1      # viewport height, tracked from <Configure>
+        self._pool = []      # [[row, tag, y, visible]]
+        self._window = None  # (first, last) item range currently bound
+        self._region = None  # scrollregion last set on the canvas
+        self._rows_by_tag = {}
+
+        self._empty_id = canvas.create_text(
+            0, 10, anchor="n", text=empty_text, state="hidden",
+            fill=empty_color or APP_COLORS["text_secondary"], font=empty_font or ("Segoe UI", 9))
+
+        canvas.configure(yscrollcommand=self._on_scroll)
+        canvas.bind("<Configure>", self._on_configure)
+
+    def set_items(self, items, reverse=False):
+        """Replace the rendered items and redraw the visible slice.
+
+        With ``reverse`` the list is shown last item first, without copying it.
+        """
+        self.items = items
+        self.reverse = reverse
+        self._window = None
+        self._measure_row()
+        self._update_scrollregion()
+        self.canvas.itemconfigure(self._empty_id, state="hidden" if items else "normal")
+        self.refresh()
+
+    def refresh(self):
+        """Bind pooled rows to the items currently inside the viewport"""
+        if not self.row_height:
+            return
+        canvas = self.canvas
+        row_h = self.row_height
+        first = max(0, int(canvas.canvasy(0) // row_h))
+        visible = max(self.height, row_h) // row_h + 1
+        last = min(len(self.items), first + visible + self.buffer)
+        # yscrollcommand fires for every redraw, including ones that don't
+        # change which items are in view
+        if (first, last) == self._window:
+            return
+        self._window = (first, last)
+
+        while len(self._pool) < last - first:
+            self._new_row()
+
+        # Item i always lands in slot i % size, so scrolling by a row only
+        # moves one row; the others keep their position and bound item
+        size = len(self._pool)
+        used = set()
+        for index in range(first, last):
+            slot = index % size
+            used.add(slot)
+            entry = self._pool[slot]
+            row, tag, y, visible = entry
+            self.bind_row(row, self._item(index))
+            if y != index * row_h:
+                canvas.move(tag, 0, index * row_h - y)
+                entry[2] = index * row_h
+            if not visible:
+                canvas.itemconfigure(tag, state="normal")
+                entry[3] = True
+        for slot, entry in enumerate(self._pool):
+            if entry[3] and slot not in used:
+                canvas.itemconfigure(entry[1], state="hidden")
+                entry[3] = False
+                if self.unbind_row:
+                    self.unbind_row(entry[0])
+
+    def current_row(self):
+        """Row under the pointer, for handlers bound with canvas.tag_bind"""
+        for tag in self.canvas.gettags("current"):
+            row = self._rows_by_tag.get(tag)
+            if row is not None:
+                return row
+        return None
+
+    def _item(self, index):
+        return self.items[-1 - index] if self.reverse else self.items[index]
+
+    def _new_row(self):
+        tag = f"row{len(self._pool)}"
+        row = self.make_row(self.canvas, tag)
+        if "frame" in row:
+            self.canvas.create_window(
+                0, 0, window=row["frame"], anchor="nw",
+                width=self.width, height=self.row_height or 1, tags=(tag, "stretch"))
+        self.canvas.move(f"{tag}&&east", self.width, 0)
+        self.canvas.itemconfigure(tag, state="hidden")
+        self._pool.append([row, tag, 0, False])
+        self._rows_by_tag[tag] = row
+        return row
+
+    def _measure_row(self):
+        """Take the row height from the first bound widget row (fonts differ per platform)"""
+        if self.row_height or not self.items:
+            return
+        row = self._pool[0][0] if self._pool else self._new_row()
+        self.bind_row(row, self._item(0))
+        row["frame"].update_idletasks()
+        self.row_height = max(1, row["frame"].winfo_reqheight())
+        self.canvas.itemconfigure("stretch", height=self.row_height)
+
+    def _update_scrollregion(self):
+        height = len(self.items) * (self.row_height or 0)
+        region = (0, 0, self.width, max(height, 1))
+        # Re-setting an identical region still makes Tk redraw and re-run
+        # yscrollcommand, e.g. on every edit that keeps the item count
+        if region != self._region:
+            self._region = region
+            self.canvas.configure(scrollregion=region)
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.refresh()
+
+    def _on_configure(self, event):
+        self.canvas.move("east", event.width - self.width, 0)
+        self.width = event.width
+        self.height = event.height
+        self.canvas.itemconfigure("stretch", width=event.width)
+        self.canvas.coords(self._empty_id, event.width // 2, 10)
+        self._update_scrollregion()
+        self.refresh()
+
+
 # ---------- App ---------- #
 class TodoApp:
+    _styles_applied_to = None
+    # Font objects behind the style fonts; kept here so they outlive the app
+    # instance that created them, like the style database itself
+    _style_fonts = {}
+
     def __init__(self, root):
         self.root = root
         self.root.title("ＴＡＳＫＴＯＲＹ")
@@ -212,127 +579,215 @@ class TodoApp:
         self.root.state('zoomed')
         self.root.minsize(800, 520)
 
-        self.style = ttk.Style(root)
-        self._setup_style()
-
-        self.archived_tasks = self._load_archived_tasks()
-        self.finished_tasks = self._load_finished_tasks()
-        self.tasks = self._load_active_tasks()
-        self.timers = {}
+        # Read the three task files in the background while styles are set up
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            archived = pool.submit(self._load_archived_tasks)
+            finished = pool.submit(self._load_finished_tasks)
+            active = pool.submit(self._load_active_tasks)
+
+            self.style = ttk.Style(root)
+            self._setup_style()
+            self._setup_fonts()
+
+            self.archived_tasks = archived.result()
+            self.finished_tasks = finished.result()
+            self.tasks, stray = active.result()
+        self._dirty = set()
+        self._flush_after_id = None
+        # One worker, so writes to the same file land in the order queued
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        self._archive_by_id = {t.id: t for t in self.archived_tasks}
+        self._finished_by_id = {t.id: t for t in self.finished_tasks}
+        self._migrate_stray_tasks(stray)
+        for task in chain(self.tasks, self.archived_tasks, self.finished_tasks):
+            _cache_text_keys(task)
+            _cache_created(task)
+        for task in self.archived_tasks:
+            task._archived_ts = _parse_ts(task.archived_at)
+        self.archived_tasks.sort(key=_archive_key)
+        self.finished_tasks.sort(key=_created_key)
+        self._tasks_sorted.sort(key=_created_key)
+        # Ids only ever grow, which also keeps ids of undoable deletes reserved
+        self._next_id = storage.get_next_id(chain(self.tasks, self.archived_tasks, self.finished_tasks))
+        # Running tallies for the stats bar, adjusted as tasks move around
+        self._counts = {"pending": 0, "high_pending": 0}
+        # (status, priority) -> active tasks, oldest first, for menu filters
+        self._buckets = {}
+        self._shown_counts = None
+        for t in self.tasks:
+            self._count_active(t, 1)
+        # Running timers (task id -> task), all advanced by one shared _tick_all loop
+        self.running_timers = {}
+        self._tick_after_id = None
+        self._last_tick = 0.0  # monotonic time running timers were last advanced
+        self._minimized = False  # no ticks run while the main window is minimized
         self.timer_labels = {}
+        self._search_after_id = None
+        self._shown_state = None
+        self._last_saved_hash = {}
+        self._pending_deletes = []
+        self._undo_after_id = None
+        self._undo_bar = None
+        self._flash_after_ids = {}  # label -> pending clear
+        self._details_modal = None
+        self._task_details_modal = None
+        self._task_window = None
 
         self._build_ui()
         self._render_tasks()
-        self._render_archive()
-        self._render_finished()
+        # The history panes are secondary; fill them once they are first
+        # shown, with their real size, so the task list paints first
+        self._render_when_mapped(self.archive_canvas, self._render_archive)
+        self._render_when_mapped(self.finished_canvas, self._render_finished)
+        self.root.after(PREBUILD_DELAY_MS, self._prebuild_windows)
 
-    def _bind_mousewheel(self, widget, canvas):
-        """Bind mouse wheel events to canvas for scrolling"""
-        def on_mousewheel(event):
-            if event.num == 5 or event.delta < 0:
-                canvas.yview_scroll(1, "units")
-            elif event.num == 4 or event.delta > 0:
-                canvas.yview_scroll(-1, "units")
-        
-        widget.bind("<Enter>", lambda e: self._bind_wheel_to_canvas(canvas))
-        widget.bind("<Leave>", lambda e: self._unbind_wheel_from_canvas(canvas))
-        
-    def _bind_wheel_to_canvas(self, canvas):
-        """Bind wheel events when mouse enters the area"""
-        canvas.bind_all("<MouseWheel>", lambda e: canvas.yview_scroll(int(-1*(e.delta/120)), "units"))
-        canvas.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
-        canvas.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
-        
-    def _unbind_wheel_from_canvas(self, canvas):
-        """Unbind wheel events when mouse leaves the area"""
-        canvas.unbind_all("<MouseWheel>")
-        canvas.unbind_all("<Button-4>")
-        canvas.unbind_all("<Button-5>")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        atexit.register(self._flush_dirty, wait=True)
+
+    def _on_global_wheel(self, event):
+        """Scroll the list under the pointer; one binding serves every pane"""
+        try:
+            widget = self.root.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            # Pointer is over a Tk-internal window (e.g. an open menu)
+            return
+        while widget is not None and widget not in self._wheel_targets:
+            widget = widget.master
+        if widget is None:
+            return
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        elif event.delta == 0:
+            # Some touchpads report zero-delta wheel events
+            return
+        else:
+            step = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self._wheel_targets[widget].yview_scroll(step, "units")
+
+    @property
+    def tasks(self):
+        """Active tasks, oldest first (kept sorted like the history lists)"""
+        return self._tasks_sorted
+
+    @tasks.setter
+    def tasks(self, tasks):
+        self._tasks_by_id = {t.id: t for t in tasks}
+        self._tasks_sorted = list(self._tasks_by_id.values())
+
+    def _add_active(self, task: Task):
+        """Put a task (already in its active state) into the active list"""
+        self._tasks_by_id[task.id] = task
+        bisect.insort(self._tasks_sorted, task, key=_created_key)
+        self._count_active(task, 1)
+
+    def _remove_active(self, task: Task):
+        """Take a task out of the active list, before its status changes"""
+        self._tasks_by_id.pop(task.id, None)
+        _remove_sorted(self._tasks_sorted, task, _created_key)
+        self._count_active(task, -1)
 
     def _load_archived_tasks(self):
         """Load archived tasks from archive file"""
-        if os.path.exists(ARCHIVE_PATH):
-            tasks = storage.load_tasks(ARCHIVE_PATH)
-            # Ensure archived_at attribute exists on all archived tasks
-            for task in tasks:
-                if not hasattr(task, 'archived_at') or task.archived_at is None:
-                    # Use created_at as fallback for old archived tasks
-                    if hasattr(task, 'created_at') and task.created_at:
-                        task.archived_at = task.created_at
-                    else:
-                        task.archived_at = datetime.now().isoformat()
-            return tasks
-        return []
+        tasks = storage.load_tasks(ARCHIVE_PATH)
+        # Ensure archived_at is set on all archived tasks
+        for task in tasks:
+            if task.archived_at is None:
+                # Use created_at as fallback for old archived tasks
+                if task.created_at:
+                    task.archived_at = task.created_at
+                else:
+                    task.archived_at = datetime.now().isoformat()
+        return tasks
 
     def _load_finished_tasks(self):
         """Load finished tasks from finished file"""
-        if os.path.exists(FINISHED_PATH):
-            tasks = storage.load_tasks(FINISHED_PATH)
-            # Ensure completed_at attribute exists on all finished tasks
-            for task in tasks:
-                # If completed_at doesn't exist or is None, set a default
-                if not hasattr(task, 'completed_at') or task.completed_at is None:
-                    # Use created_at as fallback for old tasks without completion time
-                    if hasattr(task, 'created_at') and task.created_at:
-                        task.completed_at = task.created_at
-                    else:
-                        task.completed_at = datetime.now().isoformat()
-            return tasks
-        return []
+        tasks = storage.load_tasks(FINISHED_PATH)
+        # Ensure completed_at attribute exists on all finished tasks
+        for task in tasks:
+            # If completed_at doesn't exist or is None, set a default
+            if task.completed_at is None:
+                # Use created_at as fallback for old tasks without completion time
+                if task.created_at:
+                    task.completed_at = task.created_at
+                else:
+                    task.completed_at = datetime.now().isoformat()
+        return tasks
         
 
     def _load_active_tasks(self):
-        """Load active tasks, excluding archived and finished tasks"""
-        all_tasks = storage.load_tasks(TASKS_PATH)
-        return [task for task in all_tasks if getattr(task, 'status', 'pending') not in ('archived', 'done')]
+        """Load the tasks file as (active, stray archived/done) tasks"""
+        return storage.load_partitioned(TASKS_PATH, ("archived", "done"))
+
+    def _migrate_stray_tasks(self, stray):
+        """Move archived/done tasks left in the tasks file to their own files
+
+        Older versions could leave them behind in tasks.json. They are moved
+        once (skipping any already present in the other file) and the files
+        are marked dirty, so later loads find none.
+        """
+        if not stray:
+            return
+        for task in stray:
+            if task.status == "archived" and task.id not in self._archive_by_id:
+                task.archived_at = task.archived_at or task.created_at or datetime.now().isoformat()
+                self._archive_by_id[task.id] = task
+                self.archived_tasks.append(task)
+            elif task.status == "done" and task.id not in self._finished_by_id:
+                task.completed_at = task.completed_at or task.created_at or datetime.now().isoformat()
+                self._finished_by_id[task.id] = task
+                self.finished_tasks.append(task)
+        logging.info(f"Moved {len(stray)} archived/done tasks out of {TASKS_PATH}")
+        self._mark_dirty(TASKS_PATH)
+        self._mark_dirty(ARCHIVE_PATH)
+        self._mark_dirty(FINISHED_PATH)
+
+    def _on_root_configure(self, event):
+        # Child widgets' <Configure> events also reach the root's bindings
+        if event.widget is self.root:
+            self._root_geom = (event.x, event.y, event.width, event.height)
+
+    def _place_modal(self, win, width, height, header_height=80):
+        """Size a child window and centre it horizontally under the header"""
+        root_x, root_y, root_width, _ = self._root_geom
+        position_x = root_x + (root_width - width) // 2
+        position_y = root_y + header_height
+        win.geometry(f"{width}x{height}+{position_x}+{position_y}")
 
     def _setup_style(self):
-        try:
-            self.style.theme_use("clam")
-        except:
-            pass
-        default_font = ("Segoe UI", 10)
-        self.style.configure(".", font=default_font, background=APP_COLORS["bg_main"])
-        self.style.configure("TFrame", background=APP_COLORS["bg_main"])
-        
-        self.style.configure("Card.TFrame",
-            background=APP_COLORS["bg_card"], 
-            relief="flat",
-            borderwidth=0)
-        
-        self.style.configure("Archive.TFrame",
-            background=APP_COLORS["bg_card"], 
-            relief="flat",
-            borderwidth=0)
-        
-        self.style.configure("Finished.TFrame",
-            background=APP_COLORS["bg_card"], 
-            relief="flat",
-            borderwidth=0)
-        
-        self.style.configure("Header.TLabel",
-            font=("Segoe UI", 20, "bold"),
-            foreground=APP_COLORS["text_primary"], background=APP_COLORS["bg_card"])
-        self.style.configure("Muted.TLabel",
-            font=("Segoe UI", 9),
-            foreground=APP_COLORS["text_secondary"], background=APP_COLORS["bg_card"])
-        self.style.configure("Archive.TLabel",
-            font=("Segoe UI", 9),
-            foreground=APP_COLORS["archive"], background=APP_COLORS["bg_card"])
-        self.style.configure("Finished.TLabel",
-            font=("Segoe UI", 9),
-            foreground=APP_COLORS["success"], background=APP_COLORS["bg_card"])
-        self.style.configure("TButton", font=("Segoe UI", 10),
-                            padding=(12, 6), relief="flat", borderwidth=1)
-        self.style.configure("Accent.TButton", font=("Segoe UI", 10, "bold"),
-                            padding=(12, 6), background=APP_COLORS["accent"], foreground="white")
-        self.style.configure("Success.TButton", background=APP_COLORS["success"], foreground="white")
-        self.style.configure("Danger.TButton", background=APP_COLORS["error"], foreground="white")
-        self.style.configure("Archive.TButton", background=APP_COLORS["archive"], foreground="white")
-        self.style.configure("TEntry", fieldbackground=APP_COLORS["bg_card"], borderwidth=1, relief="solid")
-        self.style.configure("Reopen.TButton", background="#838b94", foreground="white")
+        # The style database belongs to the Tk interpreter, so configure it once
+        if TodoApp._styles_applied_to is not self.root.tk:
+            try:
+                self.style.theme_use("clam")
+            except:
+                pass
+            # Styles share one Font object per distinct font tuple, so Tk
+            # resolves each description once instead of once per style
+            fonts = {}
+            for name, options in _STYLE_SPEC:
+                font = options.get("font")
+                if font is not None:
+                    if font not in fonts:
+                        fonts[font] = tkFont.Font(self.root, font=font)
+                    options = {**options, "font": fonts[font]}
+                self.style.configure(name, **options)
+            TodoApp._style_fonts = fonts
+            TodoApp._styles_applied_to = self.root.tk
         self.root.configure(bg=APP_COLORS["bg_main"])
 
+    def _setup_fonts(self):
+        """Create the shared Font objects once; widgets reuse them by reference"""
+        family = "Segoe UI"
+        self._f_ui8 = tkFont.Font(self.root, family=family, size=8)
+        self._f_ui9 = tkFont.Font(self.root, family=family, size=9)
+        self._f_ui9b = tkFont.Font(self.root, family=family, size=9, weight="bold")
+        self._f_ui10 = tkFont.Font(self.root, family=family, size=10)
+        self._f_ui10b = tkFont.Font(self.root, family=family, size=10, weight="bold")
+        self._f_ui11 = tkFont.Font(self.root, family=family, size=11)
+        self._f_ui12b = tkFont.Font(self.root, family=family, size=12, weight="bold")
+        self._f_ui24b = tkFont.Font(self.root, family=family, size=24, weight="bold")
+
     def _build_ui(self):
         top = ttk.Frame(self.root, padding=(10), style="Card.TFrame")
         top.grid(row=0, column=0, columnspan=3, sticky="ew", padx=12, pady=(12,6))
@@ -359,28 +814,32 @@ class TodoApp:
         search_frame.grid(row=0, column=1, sticky="ew", padx=12)
         search_frame.columnconfigure(1, weight=1)
         
-        search_icon = ttk.Label(search_frame, text="🔍", font=("Segoe UI", 10))
+        search_icon = ttk.Label(search_frame, text="🔍", font=self._f_ui10)
         search_icon.grid(row=0, column=0, padx=(0,8))
         
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var,
-                               font=("Segoe UI", 10))
+                               font=self._f_ui10)
         search_entry.grid(row=0, column=1, sticky="ew")
-        self.search_var.trace_add("write", lambda *args: self._render_tasks())
+        self.search_var.trace_add("write", self._on_search_changed)
 
         filter_frame = ttk.Frame(top)
         filter_frame.grid(row=0, column=2, sticky="e", padx=12)
         
+        # The StringVars hold the menu labels for display; the canonical
+        # values are resolved once per pick and kept for filtering
+        self._status_value = "all"
+        self._prio_value = "all"
         self.status_filter = tk.StringVar(value="all")
         status_menu = ttk.OptionMenu(filter_frame, self.status_filter, "all", 
                                    "🔄 All", "📝 Pending", "✓ Done",
-                                   command=lambda _e: self._render_tasks())
+                                   command=self._on_status_picked)
         status_menu.grid(row=0, column=0, padx=6)
 
         self.priority_filter = tk.StringVar(value="all")
         priority_menu = ttk.OptionMenu(filter_frame, self.priority_filter, "all",
-                                     "📊 All", "🔴 High", "🔵 Medium", "🟢 Low",
-                                     command=lambda _e: self._render_tasks())
+                                     "📊 All", *PRIO_LABELS.values(),
+                                     command=self._on_priority_picked)
         priority_menu.grid(row=0, column=1, padx=6)
 
         sort_btn = ttk.Button(filter_frame, text="📅 Newest",
@@ -404,8 +863,11 @@ class TodoApp:
         stats_card = ttk.Frame(left, style="Card.TFrame", padding=12)
         stats_card.grid(row=0, column=0, sticky="nwe", padx=12)
         stats_title = ttk.Label(stats_card, text="Overview", 
-                              font=("Segoe UI", 12, "bold"))
+                              font=self._f_ui12b)
         stats_title.grid(row=0, column=0, sticky="w")
+        # Inline notices, shown instead of modal dialogs
+        self.flash_label = ttk.Label(stats_card, text="", foreground=APP_COLORS["error"])
+        self.flash_label.grid(row=0, column=1, sticky="e", padx=(12, 0))
         self.stats_label = ttk.Label(stats_card, text="", 
                                    style="Muted.TLabel")
         self.stats_label.grid(row=1, column=0, sticky="w", pady=(8,0))
@@ -420,7 +882,7 @@ class TodoApp:
         archive_header.columnconfigure(1, weight=1)
         
         archive_title = ttk.Label(archive_header, text="🗂️ Archive", 
-                                font=("Segoe UI", 12, "bold"),
+                                font=self._f_ui12b,
                                 foreground=APP_COLORS["archive"])
         archive_title.grid(row=0, column=0, sticky="w")
         
@@ -441,23 +903,21 @@ class TodoApp:
         self.archive_scroll = ModernScrollbar(self.archive_frame, 
                                              orient="vertical", 
                                              command=self.archive_canvas.yview)
-        self.archive_list_frame = ttk.Frame(self.archive_canvas)
-        
-        self.archive_list_frame.bind(
-            "<Configure>",
-            lambda e: self.archive_canvas.configure(scrollregion=self.archive_canvas.bbox("all"))
-        )
-        self.archive_canvas.create_window((0,0), window=self.archive_list_frame, anchor="nw")
-        self.archive_canvas.configure(yscrollcommand=self.archive_scroll.set)
+        self._archive_list = VirtualList(self.archive_canvas, self.archive_scroll,
+                                         self._make_archive_row, self._bind_archive_row,
+                                         row_height=HISTORY_ROW_HEIGHT,
+                                         empty_text="No archived tasks",
+                                         empty_color=APP_COLORS["archive"],
+                                         empty_font=self._f_ui9)
+        self._bind_history_actions(self._archive_list,
+                                   lambda t: self._show_history_details(t, "archived"),
+                                   self._restore_task, self._permanently_delete_task)
         
         self.archive_canvas.grid(row=0, column=0, sticky="nsew")
         self.archive_scroll.grid(row=0, column=1, sticky="ns")
         self.archive_frame.columnconfigure(0, weight=1)
         self.archive_frame.rowconfigure(0, weight=1)
 
-        self._bind_mousewheel(self.archive_frame, self.archive_canvas)
-        self._bind_mousewheel(self.archive_canvas, self.archive_canvas)
-
         # Finished card with modern scrollbar
         finished_card = ttk.Frame(left, style="Card.TFrame", padding=12)
         finished_card.grid(row=2, column=0, sticky="nwse", padx=12, pady=(12,0))
@@ -468,7 +928,7 @@ class TodoApp:
         finished_header.columnconfigure(1, weight=1)
         
         finished_title = ttk.Label(finished_header, text="✨ Finished", 
-                                  font=("Segoe UI", 12, "bold"),
+                                  font=self._f_ui12b,
                                   foreground=APP_COLORS["success"])
         finished_title.grid(row=0, column=0, sticky="w")
         
@@ -489,301 +949,160 @@ class TodoApp:
         self.finished_scroll = ModernScrollbar(self.finished_frame,
                                               orient="vertical",
                                               command=self.finished_canvas.yview)
-        self.finished_list_frame = ttk.Frame(self.finished_canvas)
-        self.finished_list_frame.bind(
-            "<Configure>",
-            lambda e: self.finished_canvas.configure(scrollregion=self.finished_canvas.bbox("all"))
-        )
-        self.finished_canvas.create_window((0,0), window=self.finished_list_frame, anchor="nw")
-        self.finished_canvas.configure(yscrollcommand=self.finished_scroll.set)
+        self._finished_list = VirtualList(self.finished_canvas, self.finished_scroll,
+                                          self._make_finished_row, self._bind_finished_row,
+                                          row_height=HISTORY_ROW_HEIGHT,
+                                          empty_text="No finished tasks",
+                                          empty_color=APP_COLORS["success"],
+                                          empty_font=self._f_ui9)
+        self._bind_history_actions(self._finished_list,
+                                   lambda t: self._show_history_details(t, "finished"),
+                                   self._undo_done, self._permanently_delete_finished_task)
         self.finished_canvas.grid(row=0, column=0, sticky="nsew")
         self.finished_scroll.grid(row=0, column=1, sticky="ns")
         self.finished_frame.columnconfigure(0, weight=1)
         self.finished_frame.rowconfigure(0, weight=1)
 
-        self._bind_mousewheel(self.finished_frame, self.finished_canvas)
-        self._bind_mousewheel(self.finished_canvas, self.finished_canvas)
-
         self._update_stats()
 
         # Main task list with modern scrollbar
         self.task_canvas = tk.Canvas(right, borderwidth=0, highlightthickness=0, bg=APP_COLORS["bg_main"])
         self.task_scroll = ModernScrollbar(right, orient="vertical", command=self.task_canvas.yview)
-        self.task_frame = ttk.Frame(self.task_canvas, style="TFrame")
-
-        self.task_frame.bind(
-            "<Configure>",
-            lambda e: self.task_canvas.configure(scrollregion=self.task_canvas.bbox("all"))
-        )
-        self.task_canvas.create_window((0,0), window=self.task_frame, anchor="nw")
-        self.task_canvas.configure(yscrollcommand=self.task_scroll.set)
+        self._task_list = VirtualList(self.task_canvas, self.task_scroll,
+                                      self._make_task_row, self._bind_task_row,
+                                      unbind_row=self._unbind_task_row)
 
         self.task_canvas.grid(row=0, column=0, sticky="nswe")
         self.task_scroll.grid(row=0, column=1, sticky="ns")
 
-        self._bind_mousewheel(right, self.task_canvas)
-        self._bind_mousewheel(self.task_canvas, self.task_canvas)
+        # Containers map to the canvas they scroll (e.g. wheel over a scrollbar)
+        self._wheel_targets = {
+            self.archive_frame: self.archive_canvas,
+            self.finished_frame: self.finished_canvas,
+            right: self.task_canvas,
+        }
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind(sequence, self._on_global_wheel)
+
+        # Modals are centred on the main window; track its geometry here
+        # rather than querying winfo_* each time one opens
+        self._root_geom = (0, 0, 1, 1)
+        self.root.bind("<Configure>", self._on_root_configure)
+        # Timers don't tick while minimized; the time is credited on restore
+        self.root.bind("<Unmap>", self._on_root_unmap)
+        self.root.bind("<Map>", self._on_root_map)
 
         right.columnconfigure(0, weight=1)
         right.rowconfigure(0, weight=1)
 
         self.sort_newest = True
 
-    def _render_archive(self):
-        for child in self.archive_list_frame.winfo_children():
-            child.destroy()
-        
-        if not self.archived_tasks:
-            no_archive_label = ttk.Label(self.archive_list_frame, 
-                                       text="No archived tasks", 
-                                       style="Archive.TLabel")
-            no_archive_label.pack(pady=10)
-            return
-        
-        sorted_archive = sorted(self.archived_tasks, 
-                              key=lambda t: t.archived_at if hasattr(t, 'archived_at') else t.created_at, 
-                              reverse=True)
-        
-        for i, task in enumerate(sorted_archive):
-            self._create_archive_item(task, i)
+    def _render_when_mapped(self, widget, render):
+        """Call render once, the first time widget is mapped"""
+        def on_map(event):
+            widget.unbind("<Map>")
+            render()
+        widget.bind("<Map>", on_map)
 
-        self._update_stats()
+    def _render_archive(self):
+        self._archive_list.set_items(self.archived_tasks, reverse=True)
 
     def _render_finished(self):
-        for child in self.finished_list_frame.winfo_children():
-            child.destroy()
-
-        if not self.finished_tasks:
-            no_finished_label = ttk.Label(self.finished_list_frame,
-                                         text="No finished tasks",
-                                         style="Finished.TLabel")
-            no_finished_label.pack(pady=10)
-            return
-
-        sorted_finished = sorted(self.finished_tasks, key=lambda t: t.created_at, reverse=True)
-        for i, task in enumerate(sorted_finished):
-            self._create_finished_item(task, i)
-
-        self._update_stats()
-
-    def _truncate_text(self, text, max_length=40):
-        if len(text) <= max_length:
-            return text
-        return text[:max_length-3] + "..."
-
-    def _create_archive_item(self, task: Task, index: int):
-        item_frame = ttk.Frame(self.archive_list_frame, style="Card.TFrame", padding=8)
-        item_frame.pack(fill="x", padx=2, pady=2)
-        
-        item_frame.columnconfigure(0, weight=0, minsize=30)
-        item_frame.columnconfigure(1, weight=1, minsize=100)
-        item_frame.columnconfigure(2, weight=0, minsize=80)
-        
-        icon_label = ttk.Label(item_frame, text="🗂️", font=("Segoe UI", 10))
-        icon_label.grid(row=0, column=0, sticky="w", padx=(0, 8))
-        
-        # Main content frame
-        content_frame = ttk.Frame(item_frame)
-        content_frame.grid(row=0, column=1, sticky="w")
-        
-        truncated_title = self._truncate_text(task.title, max_length=25)
-        title_label = ttk.Label(content_frame, 
-                              text=truncated_title, 
-                              font=("Segoe UI", 10),
-                              foreground=APP_COLORS["archive"],
-                              cursor="hand2")
-        title_label.pack(anchor="w")
-        title_label.bind("<Button-1>", lambda e, t=task: self._show_archived_task_details(t))
-        
-        # Show archived date/time - NEW SECTION
-        if hasattr(task, 'archived_at') and task.archived_at:
-            try:
-                archived_dt = datetime.fromisoformat(task.archived_at)
-                archived_str = archived_dt.strftime("%b %d, %Y %I:%M %p")
-                archived_label = ttk.Label(content_frame,
-                                          text=f"Archived: {archived_str}",
-                                          font=("Segoe UI", 8),
-                                          foreground=APP_COLORS["archive"])
-                archived_label.pack(anchor="w")
-            except Exception as e:
-                # Fallback if date parsing fails
-                archived_label = ttk.Label(content_frame,
-                                          text=f"Archived: {task.archived_at}",
-                                          font=("Segoe UI", 8),
-                                          foreground=APP_COLORS["archive"])
-                archived_label.pack(anchor="w")
-        
-        btn_frame = ttk.Frame(item_frame)
-        btn_frame.grid(row=0, column=2, sticky="e")
-        
-        restore_btn = ttk.Button(btn_frame, text="🔄", 
-                               width=3,
-                               style="Archive.TButton",
-                               command=lambda t=task: self._restore_task(t))
-        restore_btn.grid(row=0, column=0, padx=2)
-        
-        delete_btn = ttk.Button(btn_frame, text="🗑️", 
-                              width=3,
-                              style="Danger.TButton",
-                              command=lambda t=task: self._permanently_delete_task(t))
-        delete_btn.grid(row=0, column=1, padx=2)
-
-    def _create_finished_item(self, task: Task, index: int):
-        item_frame = ttk.Frame(self.finished_list_frame, style="Card.TFrame", padding=8)
-        item_frame.pack(fill="x", padx=2, pady=2)
-        
-        item_frame.columnconfigure(0, weight=0, minsize=30)
-        item_frame.columnconfigure(1, weight=1, minsize=100)
-        item_frame.columnconfigure(2, weight=0, minsize=80)
-        
-        icon_label = ttk.Label(item_frame, text="✨", font=("Segoe UI", 10))
-        icon_label.grid(row=0, column=0, sticky="w", padx=(0, 8))
-        
-        # Main content frame
-        content_frame = ttk.Frame(item_frame)
-        content_frame.grid(row=0, column=1, sticky="w")
-        
-        truncated_title = self._truncate_text(task.title, max_length=25)
-        title_label = ttk.Label(content_frame, 
-                              text=f"✓ {truncated_title}", 
-                              font=("Segoe UI", 10),
-                              foreground=APP_COLORS["text_secondary"],
-                              cursor="hand2")
-        title_label.pack(anchor="w")
-        title_label.bind("<Button-1>", lambda e, t=task: self._show_finished_task_details(t))
-        
-        # Show completion date/time
-        if hasattr(task, 'completed_at') and task.completed_at:
-            try:
-                completed_dt = datetime.fromisoformat(task.completed_at)
-                completed_str = completed_dt.strftime("%b %d, %Y %I:%M %p")
-                completed_label = ttk.Label(content_frame,
-                                          text=f"Completed: {completed_str}",
-                                          font=("Segoe UI", 8),
-                                          foreground=APP_COLORS["success"])
-                completed_label.pack(anchor="w")
-            except Exception as e:
-                # Fallback if date parsing fails
-                completed_label = ttk.Label(content_frame,
-                                          text=f"Completed: {task.completed_at}",
-                                          font=("Segoe UI", 8),
-                                          foreground=APP_COLORS["success"])
-                completed_label.pack(anchor="w")
-        
-        btn_frame = ttk.Frame(item_frame)
-        btn_frame.grid(row=0, column=2, sticky="e")
-        
-        reopen_btn = ttk.Button(btn_frame, text="🔄", 
-                               width=3,
-                               style="Reopen.TButton",
-                               command=lambda t=task: self._undo_done(t))
-        reopen_btn.grid(row=0, column=0, padx=2)
-        
-        delete_btn = ttk.Button(btn_frame, text="🗑️", 
-                              width=3,
-                              style="Danger.TButton",
-                              command=lambda t=task: self._permanently_delete_finished_task(t))
-        delete_btn.grid(row=0, column=1, padx=2)
-
-    def _create_finished_item(self, task: Task, index: int):
-        item_frame = ttk.Frame(self.finished_list_frame, style="Card.TFrame", padding=8)
-        item_frame.pack(fill="x", padx=2, pady=2)
-        
-        item_frame.columnconfigure(0, weight=0, minsize=30)
-        item_frame.columnconfigure(1, weight=1, minsize=100)
-        item_frame.columnconfigure(2, weight=0, minsize=80)
-        
-        icon_label = ttk.Label(item_frame, text="✨", font=("Segoe UI", 10))
-        icon_label.grid(row=0, column=0, sticky="w", padx=(0, 8))
-        
-        # Main content frame
-        content_frame = ttk.Frame(item_frame)
-        content_frame.grid(row=0, column=1, sticky="w")
-        
-        truncated_title = self._truncate_text(task.title, max_length=25)
-        title_label = ttk.Label(content_frame, 
-                              text=f"✓ {truncated_title}", 
-                              font=("Segoe UI", 10),
-                              foreground=APP_COLORS["text_secondary"],
-                              cursor="hand2")
-        title_label.pack(anchor="w")
-        title_label.bind("<Button-1>", lambda e, t=task: self._show_finished_task_details(t))
-        
-        # Show completion date/time - FIXED SECTION
-        if hasattr(task, 'completed_at') and task.completed_at:
-            try:
-                completed_dt = datetime.fromisoformat(task.completed_at)
-                completed_str = completed_dt.strftime("%b %d, %Y %I:%M %p")
-                completed_label = ttk.Label(content_frame,
-                                          text=f"Completed: {completed_str}",
-                                          font=("Segoe UI", 8),
-                                          foreground=APP_COLORS["success"])
-                completed_label.pack(anchor="w")
-            except Exception as e:
-                # Fallback if date parsing fails
-                completed_label = ttk.Label(content_frame,
-                                          text=f"Completed: {task.completed_at}",
-                                          font=("Segoe UI", 8),
-                                          foreground=APP_COLORS["success"])
-                completed_label.pack(anchor="w")
-        
-        btn_frame = ttk.Frame(item_frame)
-        btn_frame.grid(row=0, column=2, sticky="e")
-        
-        reopen_btn = ttk.Button(btn_frame, text="🔄", 
-                               width=3,
-                               style="Reopen.TButton",
-                               command=lambda t=task: self._undo_done(t))
-        reopen_btn.grid(row=0, column=0, padx=2)
-        
-        delete_btn = ttk.Button(btn_frame, text="🗑️", 
-                              width=3,
-                              style="Danger.TButton",
-                              command=lambda t=task: self._permanently_delete_finished_task(t))
-        delete_btn.grid(row=0, column=1, padx=2)
-
-    def _show_archived_task_details(self, task: Task):
+        self._finished_list.set_items(self.finished_tasks, reverse=True)
+
+    def _make_history_row(self, canvas, tag, icon, title_color, stamp_color, first_color):
+        """Draw one pooled archive/finished row as canvas items instead of widgets.
+
+        Clicks are handled by the tag bindings from _bind_history_actions.
+        """
+        mid = HISTORY_ROW_HEIGHT // 2
+        canvas.create_text(12, mid, anchor="w", text=icon, font=self._f_ui10, tags=(tag,))
+        title = canvas.create_text(44, mid - 9, anchor="w", fill=title_color,
+                                   font=self._f_ui10, tags=(tag, "title"))
+        stamp = canvas.create_text(44, mid + 10, anchor="w", fill=stamp_color,
+                                   font=self._f_ui8, tags=(tag,))
+        for x, action, text, color in ((-72, "first", "🔄", first_color),
+                                       (-38, "delete", "🗑️", APP_COLORS["error"])):
+            canvas.create_rectangle(x, mid - 13, x + 30, mid + 13, fill=color, outline="",
+                                    tags=(tag, "east", action))
+            canvas.create_text(x + 15, mid, text=text, fill="white", font=self._f_ui10,
+                               tags=(tag, "east", action))
+        return {"task": None, "title": title, "stamp": stamp}
+
+    def _bind_history_actions(self, vlist, on_title, on_first, on_delete):
+        """Bind row clicks once per canvas and dispatch to the task under the pointer"""
+        canvas = vlist.canvas
+        for action, handler in (("title", on_title), ("first", on_first), ("delete", on_delete)):
+            canvas.tag_bind(action, "<Button-1>",
+                            lambda e, h=handler: h(vlist.current_row()["task"]))
+            canvas.tag_bind(action, "<Enter>", lambda e: canvas.configure(cursor="hand2"))
+            canvas.tag_bind(action, "<Leave>", lambda e: canvas.configure(cursor=""))
+
+    def _make_archive_row(self, canvas, tag):
+        return self._make_history_row(canvas, tag, "🗂️", APP_COLORS["archive"], APP_COLORS["archive"],
+                                      APP_COLORS["archive"])
+
+    def _bind_archive_row(self, row, task: Task):
+        row["task"] = task
+        canvas = self.archive_canvas
+        canvas.itemconfigure(row["title"], text=task._title_short)
+        canvas.itemconfigure(row["stamp"], text=_stamp_row("Archived", task.archived_at))
+
+    def _make_finished_row(self, canvas, tag):
+        return self._make_history_row(canvas, tag, "✨", APP_COLORS["text_secondary"], APP_COLORS["success"],
+                                      "#838b94")
+
+    def _bind_finished_row(self, row, task: Task):
+        row["task"] = task
+        canvas = self.finished_canvas
+        canvas.itemconfigure(row["title"], text=f"✓ {task._title_short}")
+        canvas.itemconfigure(row["stamp"], text=_stamp_row("Completed", task.completed_at))
+
+    def _format_span(self, start_iso, end_iso):
+        duration = datetime.fromisoformat(end_iso) - datetime.fromisoformat(start_iso)
+        days = duration.days
+        hours = duration.seconds // 3600
+        minutes = (duration.seconds % 3600) // 60
+        
+        duration_parts = []
+        if days > 0:
+            duration_parts.append(f"{days} day{'s' if days != 1 else ''}")
+        if hours > 0:
+            duration_parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+        if minutes > 0:
+            duration_parts.append(f"{minutes} min{'s' if minutes != 1 else ''}")
+        
+        return ", ".join(duration_parts) if duration_parts else "Less than a minute"
+
+    def _build_history_details(self):
+        """Build the archived/finished details window once; later opens only re-fill it"""
+        # Imported here: only the details and edit windows use it, and
+        # they are built after startup
+        from tkinter.scrolledtext import ScrolledText
         modal = tk.Toplevel(self.root)
+        modal.withdraw()
         modal.transient(self.root)
-        modal.grab_set()
-        
-        window_width = 700
-        window_height = 550
-        header_height = 80
-        
-        root_x = self.root.winfo_x()
-        root_y = self.root.winfo_y()
-        root_width = self.root.winfo_width()
-        
-        position_x = root_x + (root_width - window_width) // 2
-        position_y = root_y + header_height
-        
-        modal.geometry(f"{window_width}x{window_height}+{position_x}+{position_y}")
-        modal.title("Archived Task Details")
         modal.configure(bg=APP_COLORS["bg_main"])
         modal.resizable(False, False)
+        modal.protocol("WM_DELETE_WINDOW", self._hide_history_details)
 
         container = ttk.Frame(modal, style="Card.TFrame", padding=0)
         container.pack(fill="both", expand=True, padx=20, pady=20)
 
-        header = tk.Frame(container, bg=APP_COLORS["archive"])
+        header = tk.Frame(container)
         header.pack(fill="x")
         
-        header_content = tk.Frame(header, bg=header["bg"])
+        header_content = tk.Frame(header)
         header_content.pack(fill="x", padx=25, pady=20)
 
         status_label = tk.Label(header_content,
-            text="🗂️ ARCHIVED TASK",
-            bg=header["bg"],
             fg="white",
-            font=("Segoe UI", 11))
+            font=self._f_ui11)
         status_label.pack(anchor="w", pady=(0, 10))
         
         title_label = tk.Label(header_content,
-            text=task.title,
-            bg=header["bg"],
             fg="white",
-            font=("Segoe UI", 24, "bold"),
+            font=self._f_ui24b,
             wraplength=600,
             justify="left")
         title_label.pack(fill="x", anchor="w")
@@ -791,290 +1110,360 @@ class TodoApp:
         content = ttk.Frame(container, style="Card.TFrame", padding=(25, 20))
         content.pack(fill="both", expand=True)
 
-        # Date information frame - ADD THIS SECTION
+        # Date information frame
         dates_frame = ttk.Frame(content)
         dates_frame.pack(fill="x", pady=(0, 20))
-        
-        # Created date
-        try:
-            created_date = datetime.fromisoformat(task.created_at).strftime("%B %d, %Y at %I:%M %p")
-            created_label = ttk.Label(dates_frame,
-                text=f"📅 Created: {created_date}",
-                style="Muted.TLabel")
-            created_label.pack(anchor="w", pady=2)
-        except:
-            pass
-        
-        # Archived date
-        if hasattr(task, 'archived_at') and task.archived_at:
-            try:
-                archived_date = datetime.fromisoformat(task.archived_at).strftime("%B %d, %Y at %I:%M %p")
-                archived_label = ttk.Label(dates_frame,
-                    text=f"🗂️ Archived: {archived_date}",
-                    font=("Segoe UI", 10, "bold"),
-                    foreground=APP_COLORS["archive"])
-                archived_label.pack(anchor="w", pady=2)
-                
-                # Calculate duration
-                created_dt = datetime.fromisoformat(task.created_at)
-                archived_dt = datetime.fromisoformat(task.archived_at)
-                duration = archived_dt - created_dt
-                days = duration.days
-                hours = duration.seconds // 3600
-                minutes = (duration.seconds % 3600) // 60
-                
-                duration_parts = []
-                if days > 0:
-                    duration_parts.append(f"{days} day{'s' if days != 1 else ''}")
-                if hours > 0:
-                    duration_parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-                if minutes > 0:
-                    duration_parts.append(f"{minutes} min{'s' if minutes != 1 else ''}")
-                
-                duration_str = ", ".join(duration_parts) if duration_parts else "Less than a minute"
-                
-                duration_label = ttk.Label(dates_frame,
-                    text=f"⏱️ Active Duration: {duration_str}",
-                    style="Muted.TLabel")
-                duration_label.pack(anchor="w", pady=2)
-            except:
-                pass
+        created_label = ttk.Label(dates_frame, style="Muted.TLabel")
+        stamp_label = ttk.Label(dates_frame, font=self._f_ui10b)
+        duration_label = ttk.Label(dates_frame, style="Muted.TLabel")
 
         desc_frame = ttk.Frame(content)
         desc_frame.pack(fill="both", expand=True, pady=(0, 20))
         
         desc_header = ttk.Label(desc_frame,
             text="📝 Description",
-            font=("Segoe UI", 12, "bold"),
+            font=self._f_ui12b,
             foreground=APP_COLORS["text_primary"])
         desc_header.pack(anchor="w", pady=(0, 10))
         
         desc_text = ScrolledText(desc_frame,
             wrap=tk.WORD,
-            font=("Segoe UI", 10),
+            font=self._f_ui10,
             height=12,
             relief="flat",
             borderwidth=1)
         desc_text.pack(fill="both", expand=True)
-        desc_text.insert("1.0", task.description if task.description else "(No description provided)")
-        desc_text.configure(state="disabled")
 
         btn_frame = ttk.Frame(content)
         btn_frame.pack(fill="x")
 
-        restore_btn = ttk.Button(btn_frame,
-            text="🔄 Restore Task",
-            style="Archive.TButton",
-            command=lambda: [modal.destroy(), self._restore_task(task)])
-        restore_btn.pack(side="left")
+        first_btn = ttk.Button(btn_frame,
+            command=lambda: self._on_history_details_action("first"))
+        first_btn.pack(side="left")
 
         delete_btn = ttk.Button(btn_frame,
             text="🗑️ Delete Permanently",
             style="Danger.TButton",
-            command=lambda: [modal.destroy(), self._permanently_delete_task(task)])
+            command=lambda: self._on_history_details_action("delete"))
         delete_btn.pack(side="left", padx=8)
 
         close_btn = ttk.Button(btn_frame,
             text="Close",
-            command=modal.destroy)
+            command=self._hide_history_details)
         close_btn.pack(side="right")
 
-    def _show_finished_task_details(self, task: Task):
-        modal = tk.Toplevel(self.root)
-        modal.transient(self.root)
-        modal.grab_set()
-        
-        window_width = 700
-        window_height = 550
-        header_height = 80
-        
-        root_x = self.root.winfo_x()
-        root_y = self.root.winfo_y()
-        root_width = self.root.winfo_width()
-        
-        position_x = root_x + (root_width - window_width) // 2
-        position_y = root_y + header_height
-        
-        modal.geometry(f"{window_width}x{window_height}+{position_x}+{position_y}")
-        modal.title("Finished Task Details")
-        modal.configure(bg=APP_COLORS["bg_main"])
-        modal.resizable(False, False)
-
-        container = ttk.Frame(modal, style="Card.TFrame", padding=0)
-        container.pack(fill="both", expand=True, padx=20, pady=20)
-
-        header = tk.Frame(container, bg=APP_COLORS["success"])
-        header.pack(fill="x")
-        
-        header_content = tk.Frame(header, bg=header["bg"])
-        header_content.pack(fill="x", padx=25, pady=20)
-
-        status_label = tk.Label(header_content,
-            text="✨ FINISHED TASK",
-            bg=header["bg"],
-            fg="white",
-            font=("Segoe UI", 11))
-        status_label.pack(anchor="w", pady=(0, 10))
-        
-        title_label = tk.Label(header_content,
-            text=task.title,
-            bg=header["bg"],
-            fg="white",
-            font=("Segoe UI", 24, "bold"),
-            wraplength=600,
-            justify="left")
-        title_label.pack(fill="x", anchor="w")
-
-        content = ttk.Frame(container, style="Card.TFrame", padding=(25, 20))
-        content.pack(fill="both", expand=True)
+        self._details_modal = modal
+        self._details_widgets = {
+            "header": (header, header_content, status_label, title_label),
+            "status": status_label, "title": title_label,
+            "dates": (created_label, stamp_label, duration_label),
+            "desc": desc_text, "first": first_btn,
+        }
 
-        # Date information frame
-        dates_frame = ttk.Frame(content)
-        dates_frame.pack(fill="x", pady=(0, 20))
-        
-        # Created date
-        created_date = datetime.fromisoformat(task.created_at).strftime("%B %d, %Y at %I:%M %p")
-        created_label = ttk.Label(dates_frame,
-            text=f"📅 Created: {created_date}",
-            style="Muted.TLabel")
-        created_label.pack(anchor="w", pady=2)
-        
-        # Completed date
-        if hasattr(task, 'completed_at') and task.completed_at:
+    def _show_history_details(self, task: Task, kind: str):
+        """Show an archived (kind="archived") or finished (kind="finished") task"""
+        if self._details_modal is None:
+            self._build_history_details()
+        modal = self._details_modal
+        w = self._details_widgets
+        self._details_task = task
+        self._details_kind = kind
+
+        if kind == "archived":
+            color = APP_COLORS["archive"]
+            modal.title("Archived Task Details")
+            status_text = "🗂️ ARCHIVED TASK"
+            stamp = task.archived_at
+            stamp_prefix, span_prefix = "🗂️ Archived", "⏱️ Active Duration"
+            w["first"].configure(text="🔄 Restore Task", style="Archive.TButton")
+        else:
+            color = APP_COLORS["success"]
+            modal.title("Finished Task Details")
+            status_text = "✨ FINISHED TASK"
+            stamp = task.completed_at
+            stamp_prefix, span_prefix = "✨ Completed", "⏱️ Duration"
+            w["first"].configure(text="🔄 Reopen Task", style="TButton")
+
+        for widget in w["header"]:
+            widget.configure(bg=color)
+        w["status"].configure(text=status_text)
+        w["title"].configure(text=task.title)
+
+        texts = [f"📅 Created: {task._created_long}" if task._created_long else ""]
+        if stamp:
             try:
-                completed_date = datetime.fromisoformat(task.completed_at).strftime("%B %d, %Y at %I:%M %p")
-                completed_label = ttk.Label(dates_frame,
-                    text=f"✨ Completed: {completed_date}",
-                    font=("Segoe UI", 10, "bold"),
-                    foreground=APP_COLORS["success"])
-                completed_label.pack(anchor="w", pady=2)
-                
-                # Calculate duration
-                created_dt = datetime.fromisoformat(task.created_at)
-                completed_dt = datetime.fromisoformat(task.completed_at)
-                duration = completed_dt - created_dt
-                days = duration.days
-                hours = duration.seconds // 3600
-                minutes = (duration.seconds % 3600) // 60
-                
-                duration_parts = []
-                if days > 0:
-                    duration_parts.append(f"{days} day{'s' if days != 1 else ''}")
-                if hours > 0:
-                    duration_parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-                if minutes > 0:
-                    duration_parts.append(f"{minutes} min{'s' if minutes != 1 else ''}")
-                
-                duration_str = ", ".join(duration_parts) if duration_parts else "Less than a minute"
-                
-                duration_label = ttk.Label(dates_frame,
-                    text=f"⏱️ Duration: {duration_str}",
-                    style="Muted.TLabel")
-                duration_label.pack(anchor="w", pady=2)
+                texts.append(f"{stamp_prefix}: {_long_stamp(stamp)}")
+                texts.append(f"{span_prefix}: {self._format_span(task.created_at, stamp)}")
             except:
                 pass
-
-        desc_frame = ttk.Frame(content)
-        desc_frame.pack(fill="both", expand=True, pady=(0, 20))
-        
-        desc_header = ttk.Label(desc_frame,
-            text="📝 Description",
-            font=("Segoe UI", 12, "bold"),
-            foreground=APP_COLORS["text_primary"])
-        desc_header.pack(anchor="w", pady=(0, 10))
-        
-        desc_text = ScrolledText(desc_frame,
-            wrap=tk.WORD,
-            font=("Segoe UI", 10),
-            height=12,
-            relief="flat",
-            borderwidth=1)
-        desc_text.pack(fill="both", expand=True)
+        created_label, stamp_label, duration_label = w["dates"]
+        stamp_label.configure(foreground=color)
+        for label in w["dates"]:
+            label.pack_forget()
+        for label, text in zip(w["dates"], texts):
+            if text:
+                label.configure(text=text)
+                label.pack(anchor="w", pady=2)
+
+        desc_text = w["desc"]
+        desc_text.configure(state="normal")
+        desc_text.delete("1.0", "end")
         desc_text.insert("1.0", task.description if task.description else "(No description provided)")
         desc_text.configure(state="disabled")
 
-        btn_frame = ttk.Frame(content)
-        btn_frame.pack(fill="x")
-
-        reopen_btn = ttk.Button(btn_frame,
-            text="🔄 Reopen Task",
-            command=lambda: [modal.destroy(), self._undo_done(task)])
-        reopen_btn.pack(side="left")
+        self._place_modal(modal, 700, 550)
+        modal.deiconify()
+        modal.lift()
+        modal.grab_set()
 
-        delete_btn = ttk.Button(btn_frame,
-            text="🗑️ Delete Permanently",
-            style="Danger.TButton",
-            command=lambda: [modal.destroy(), self._permanently_delete_finished_task(task)])
-        delete_btn.pack(side="left", padx=8)
+    def _hide_history_details(self):
+        self._details_modal.grab_release()
+        self._details_modal.withdraw()
 
-        close_btn = ttk.Button(btn_frame,
-            text="Close",
-            command=modal.destroy)
-        close_btn.pack(side="right")
+    def _on_history_details_action(self, action):
+        task, kind = self._details_task, self._details_kind
+        self._hide_history_details()
+        if kind == "archived":
+            handler = self._restore_task if action == "first" else self._permanently_delete_task
+        else:
+            handler = self._undo_done if action == "first" else self._permanently_delete_finished_task
+        handler(task)
 
     def _restore_task(self, task: Task):
-        self.archived_tasks = [t for t in self.archived_tasks if t.id != task.id]
+        if self._archive_by_id.pop(task.id, None) is None:
+            return  # already handled, e.g. a double click
+        _remove_sorted(self.archived_tasks, task, _archive_key)
         task.status = "pending"
         task.archived_at = None  # ADD THIS LINE - Clear the archived timestamp
-        self.tasks.append(task)
+        self._add_active(task)
         
-        storage.save_tasks(TASKS_PATH, self.tasks)
-        storage.save_tasks(ARCHIVE_PATH, self.archived_tasks)
+        self._mark_dirty(TASKS_PATH)
+        self._mark_dirty(ARCHIVE_PATH)
         
         self._update_stats()
-        self._render_tasks()
+        self._sync_view(task)
         self._render_archive()
         
         logging.info(f"Restored task {task.id}: {task.title}. Remaining archived: {len(self.archived_tasks)}")
 
     def _permanently_delete_task(self, task: Task):
-        if messagebox.askyesno("Permanent Delete", 
-                             f"Permanently delete task '{task.title}'?\n\nThis action cannot be undone."):
-            self.archived_tasks = [t for t in self.archived_tasks if t.id != task.id]
-            storage.save_tasks(ARCHIVE_PATH, self.archived_tasks)
-            self._update_stats()
-            self._render_archive()
-            logging.info(f"Permanently deleted task {task.id}: {task.title}. Remaining archived: {len(self.archived_tasks)}")
+        if self._archive_by_id.pop(task.id, None) is None:
+            return  # already handled, e.g. a double click
+        _remove_sorted(self.archived_tasks, task, _archive_key)
+        self._pending_deletes.append((task, ARCHIVE_PATH))
+        self._update_stats()
+        self._render_archive()
+        self._show_undo_bar(task)
 
     def _permanently_delete_finished_task(self, task: Task):
-        if messagebox.askyesno("Permanent Delete", 
-                             f"Permanently delete finished task '{task.title}'?\n\nThis action cannot be undone."):
-            self.finished_tasks = [t for t in self.finished_tasks if t.id != task.id]
-            storage.save_tasks(FINISHED_PATH, self.finished_tasks)
-            self._update_stats()
-            self._render_finished()
-            logging.info(f"Permanently deleted finished task {task.id}: {task.title}. Remaining finished: {len(self.finished_tasks)}")
+        if self._finished_by_id.pop(task.id, None) is None:
+            return  # already handled, e.g. a double click
+        _remove_sorted(self.finished_tasks, task, _created_key)
+        self._pending_deletes.append((task, FINISHED_PATH))
+        self._update_stats()
+        self._render_finished()
+        self._show_undo_bar(task)
+
+    def _show_undo_bar(self, task: Task):
+        """Offer a non-modal Undo; every delete restarts the window so bursts write once"""
+        if self._undo_bar is None:
+            self._undo_bar = ttk.Frame(self.root, style="Card.TFrame", padding=(12, 6))
+            self._undo_label = ttk.Label(self._undo_bar, style="Muted.TLabel")
+            self._undo_label.pack(side="left")
+            undo_btn = ttk.Button(self._undo_bar, text="↩ Undo",
+                                command=self._undo_pending_deletes)
+            undo_btn.pack(side="right")
+
+        count = len(self._pending_deletes)
+        if count == 1:
+            text = f"Deleted '{task._title_row}'"
+        else:
+            text = f"Deleted {count} tasks"
+        self._undo_label.configure(text=text)
+        self._undo_bar.grid(row=2, column=0, columnspan=2, sticky="ew", padx=12, pady=(0, 12))
+
+        if self._undo_after_id:
+            self.root.after_cancel(self._undo_after_id)
+        self._undo_after_id = self.root.after(UNDO_TIMEOUT_MS, self._commit_pending_deletes)
+
+    def _flash(self, label, text):
+        """Show text in label for FLASH_MS
+
+        Used instead of messagebox dialogs, whose nested event loop blocks
+        the window until dismissed.
+        """
+        label.configure(text=text)
+        after_id = self._flash_after_ids.pop(label, None)
+        if after_id:
+            self.root.after_cancel(after_id)
+        self._flash_after_ids[label] = self.root.after(FLASH_MS, self._clear_flash, label)
+
+    def _clear_flash(self, label):
+        after_id = self._flash_after_ids.pop(label, None)
+        if after_id:
+            # Called early (e.g. on reopen): the old timer must not clear a
+            # later notice
+            self.root.after_cancel(after_id)
+        label.configure(text="")
+
+    def _hide_undo_bar(self):
+        if self._undo_after_id:
+            self.root.after_cancel(self._undo_after_id)
+            self._undo_after_id = None
+        if self._undo_bar is not None:
+            self._undo_bar.grid_remove()
+
+    def _commit_pending_deletes(self):
+        self._undo_after_id = None
+        for task, path in self._pending_deletes:
+            self._mark_dirty(path)
+            if path == ARCHIVE_PATH:
+                logging.info(f"Permanently deleted task {task.id}: {task.title}. Remaining archived: {len(self.archived_tasks)}")
+            else:
+                logging.info(f"Permanently deleted finished task {task.id}: {task.title}. Remaining finished: {len(self.finished_tasks)}")
+        self._pending_deletes.clear()
+        self._hide_undo_bar()
+
+    def _undo_pending_deletes(self):
+        for task, path in self._pending_deletes:
+            if path == ARCHIVE_PATH:
+                self._archive_by_id[task.id] = task
+                bisect.insort(self.archived_tasks, task, key=_archive_key)
+            else:
+                self._finished_by_id[task.id] = task
+                bisect.insort(self.finished_tasks, task, key=_created_key)
+            # A flush during the undo window may already have written the
+            # file without this task
+            self._mark_dirty(path)
+        self._pending_deletes.clear()
+        self._hide_undo_bar()
+        self._update_stats()
+        self._render_archive()
+        self._render_finished()
 
     def _archive_task(self, task: Task):
-        if task.id in self.timers:
+        if task.id in self.running_timers:
             self._stop_timer(task.id)
         
-        self.tasks = [t for t in self.tasks if t.id != task.id]
+        self._remove_active(task)
         
         task.status = "archived"
         task.archived_at = datetime.now().isoformat()  # ADD THIS LINE
-        self.archived_tasks.append(task)
+        task._archived_ts = _parse_ts(task.archived_at)
+        self._archive_by_id[task.id] = task
+        bisect.insort(self.archived_tasks, task, key=_archive_key)
         
-        storage.save_tasks(TASKS_PATH, self.tasks)
-        storage.save_tasks(ARCHIVE_PATH, self.archived_tasks)
+        self._mark_dirty(TASKS_PATH)
+        self._mark_dirty(ARCHIVE_PATH)
         
-        self._render_tasks()
+        self._sync_view(task)
         self._update_stats()
         self._render_archive()
         
         logging.info(f"Archived task {task.id}: {task.title} at {task.archived_at}")
 
+    def _mark_dirty(self, path):
+        """Queue a task file for the next flush instead of rewriting it now"""
+        self._dirty.add(path)
+        if self._flush_after_id is None:
+            self._flush_after_id = self.root.after(SAVE_DEBOUNCE_MS, self._flush_dirty)
+
+    def _flush_dirty(self, wait=False):
+        """Write every dirty task file once
+
+        Writes go to the background writer thread unless wait is true
+        (closing or exiting), in which case queued writes are finished
+        first and the rest is written inline.
+        """
+        if wait:
+            self._writer.shutdown(wait=True)
+        if self._flush_after_id is not None:
+            try:
+                self.root.after_cancel(self._flush_after_id)
+            except tk.TclError:
+                pass  # root already destroyed (flush from atexit)
+            self._flush_after_id = None
+        lists = {
+            TASKS_PATH: self.tasks,
+            ARCHIVE_PATH: self.archived_tasks,
+            FINISHED_PATH: self.finished_tasks,
+        }
+        while self._dirty:
+            path = self._dirty.pop()
+            self._save_if_changed(path, lists[path], wait)
+
+    def _save_if_changed(self, path, tasks, wait=False):
+        """Write tasks unless they match what was last written to path"""
+        h = _fingerprint(tasks)
+        if self._last_saved_hash.get(path) == h:
+            return
+        if wait:
+            if storage.save_tasks(path, tasks):
+                self._last_saved_hash[path] = h
+            return
+        # Snapshot the fields here, so edits and timer ticks made while
+        # the writer encodes can't tear the saved records
+        future = self._writer.submit(storage.save_records, path, [t.to_dict() for t in tasks])
+        # Recorded now so repeated flushes don't queue the same contents
+        # again, and forgotten if the write fails so the next flush retries
+        self._last_saved_hash[path] = h
+        future.add_done_callback(lambda f: self._forget_failed_save(f, path, h))
+
+    def _forget_failed_save(self, future, path, h):
+        """Writer-thread callback: drop the recorded hash of a failed write"""
+        if future.exception() is None and future.result():
+            return
+        if self._last_saved_hash.get(path) == h:
+            self._last_saved_hash.pop(path, None)
+
+    def _on_close(self):
+        self._commit_pending_deletes()
+        for tid in list(self.running_timers):
+            self._stop_timer(tid)
+        # Flush all three files; the fingerprint check skips any whose
+        # contents match the last write, so this only costs hashing
+        self._dirty.update((TASKS_PATH, ARCHIVE_PATH, FINISHED_PATH))
+        self._flush_dirty(wait=True)
+        self.root.destroy()
+
     def _toggle_sort(self, btn):
         self.sort_newest = not self.sort_newest
         btn.config(text=("📅 Newest" if self.sort_newest else "📅 Oldest"))
-        self._render_tasks()
+        # The shown list is already filtered and sorted; flipping the order
+        # only needs it reversed, not re-filtered
+        self._shown_tasks.reverse()
+        if self._shown_state is not None:
+            self._shown_state = (self._shown_state[0], self.sort_newest)
+        self._task_list.set_items(self._shown_tasks)
+
+    def _count_active(self, task: Task, delta):
+        """Add (delta=1) or remove (delta=-1) an active task from the tallies
+
+        Also files it under its (status, priority) bucket, so callers bracket
+        status and priority changes with -1/+1.
+        """
+        bucket = self._buckets.setdefault((task.status, task.priority), [])
+        if delta > 0:
+            bisect.insort(bucket, task, key=_created_key)
+        else:
+            _remove_sorted(bucket, task, _created_key)
+        if task.status != "done":
+            self._counts["pending"] += delta
+            if task.priority == "high":
+                self._counts["high_pending"] += delta
 
     def _update_stats(self):
-        total = len(self.tasks)
-        pending = sum(1 for t in self.tasks if t.status != "done")
-        done = len(self.finished_tasks)
-        high = sum(1 for t in self.tasks if t.priority == "high" and t.status != "done")
-        archived = len(self.archived_tasks)
+        total = len(self._tasks_by_id)
+        pending = self._counts["pending"]
+        high = self._counts["high_pending"]
+        done = len(self._finished_by_id)
+        archived = len(self._archive_by_id)
+
+        # Many mutations (edits, timer changes) leave every count unchanged
+        counts = (total, pending, done, high, archived)
+        if counts == self._shown_counts:
+            return
+        self._shown_counts = counts
         
         txt = f"Total: {total}   Pending: {pending}   Done: {done}   High priority: {high}"
         self.stats_label.config(text=txt)
@@ -1083,180 +1472,250 @@ class TodoApp:
         self.archive_count_label.config(text=archive_txt)
         self.finished_count_label.config(text=f"({done} items)")
 
-    def _render_tasks(self):
-        for child in self.task_frame.winfo_children():
-            child.destroy()
-
-        q = self.search_var.get().strip().lower()
-        status_f = self.status_filter.get()
-        prio_f = self.priority_filter.get()
-
-        tasks = list(self.tasks)
-        if status_f != "all":
-            status_map = {"🔄 All": "all", "📝 Pending": "pending", "✓ Done": "done"}
-            actual_status = status_map.get(status_f, status_f)
-            if actual_status != "all":
-                tasks = [t for t in tasks if t.status == actual_status]
-        if prio_f != "all":
-            prio_map = {"📊 All": "all", "🔴 High": "high", "🔵 Medium": "medium", "🟢 Low": "low"}
-            actual_prio = prio_map.get(prio_f, prio_f)
-            if actual_prio != "all":
-                tasks = [t for t in tasks if t.priority == actual_prio]
-        if q:
-            tasks = [t for t in tasks if q in t.title.lower() or q in t.description.lower()]
-
-        tasks.sort(key=lambda t: t.created_at, reverse=self.sort_newest)
-
-        for i, task in enumerate(tasks):
-            self._create_task_card(task, i)
+    def _on_search_changed(self, *args):
+        """Coalesce bursts of search edits into a single render"""
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(FILTER_DEBOUNCE_MS, self._render_filtered)
+
+    def _on_status_picked(self, label):
+        """Menu picks are one-off events, so render now (folding in any pending search)"""
+        self._status_value = STATUS_MAP[label]
+        self._render_filtered()
+
+    def _on_priority_picked(self, label):
+        self._prio_value = PRIO_MAP[label]
+        self._render_filtered()
+
+    def _render_filtered(self):
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = None
+        self._render_tasks()
 
-        self._update_stats()
+    def _filter_state(self):
+        """(status, priority, lowercased query) currently selected in the UI"""
+        return (self._status_value, self._prio_value,
+                self.search_var.get().strip().lower())
+
+    def _task_filter(self, state=None):
+        """Predicate for the current search text and status/priority filters
+
+        Returns None when nothing is filtered, so callers can skip the pass.
+        """
+        status, prio, q = state or self._filter_state()
+        if status == "all" and prio == "all" and not q:
+            return None
+
+        # One flat closure per combination of active filters, so each task
+        # costs just the comparisons that matter and a single call
+        if status != "all" and prio != "all":
+            if q:
+                return lambda t: t.status == status and t.priority == prio and q in t._search_lc
+            return lambda t: t.status == status and t.priority == prio
+        if status != "all":
+            if q:
+                return lambda t: t.status == status and q in t._search_lc
+            return lambda t: t.status == status
+        if prio != "all":
+            if q:
+                return lambda t: t.priority == prio and q in t._search_lc
+            return lambda t: t.priority == prio
+        return lambda t: q in t._search_lc
 
-    def _create_task_card(self, task: Task, index: int):
-        outer_card = ttk.Frame(self.task_frame, style="Card.TFrame")
-        outer_card.grid(row=index, column=0, sticky="ew", padx=12, pady=6)
+    def _render_tasks(self):
+        """Re-filter and re-sort the whole task list (search/filter/sort changes)"""
+        state = self._filter_state()
+        pred = self._task_filter(state)
+        prev = self._shown_state
+        self._shown_state = (state, self.sort_newest)
+        if (pred is not None and prev is not None and prev[1] == self.sort_newest
+                and _narrows(prev[0], state)):
+            # The new filters can only drop tasks from what is already
+            # shown, and that list is already sorted
+            tasks = list(filter(pred, self._shown_tasks))
+        else:
+            status, prio, q = state
+            base = self.tasks
+            if status != "all" or prio != "all":
+                # Menu filters are answered by the buckets; only the search
+                # text is left to test per task
+                base = self._bucketed(status, prio)
+                pred = self._task_filter(("all", "all", q))
+            # The task lists are kept in created order, so no sort is needed
+            source = reversed(base) if self.sort_newest else base
+            if pred is None:
+                tasks = list(source)
+            else:
+                tasks = list(filter(pred, source))
+
+        for task in tasks:
+            if task.id not in self.running_timers and task.status != "done":
+                self._start_timer(task)
+
+        self._shown_tasks = tasks
+        self._task_list.set_items(tasks)
+
+    def _bucketed(self, status, prio):
+        """Active tasks matching status and priority ("all" = any), oldest first"""
+        lists = [bucket for (s, p), bucket in self._buckets.items()
+                 if status in ("all", s) and prio in ("all", p)]
+        if len(lists) == 1:
+            return lists[0]
+        return list(heapq.merge(*lists, key=_created_key))
+
+    def _sync_view(self, task: Task):
+        """Update the shown list for one added, edited or removed task
+
+        The shown list stays sorted, so the task is dropped from it and, if
+        it is still active and matches the filters, inserted back in place.
+        """
+        shown = self._shown_tasks
+        key = _newest_first_key if self.sort_newest else _created_key
+        _remove_sorted(shown, task, key)
+
+        pred = self._task_filter()
+        if task.id in self._tasks_by_id and (pred is None or pred(task)):
+            bisect.insort(shown, task, key=key)
+            if task.id not in self.running_timers and task.status != "done":
+                self._start_timer(task)
+
+        self._task_list.set_items(shown)
+
+    def _make_task_row(self, parent, tag):
+        """Build one pooled task card; _bind_task_row fills it in for a task"""
+        row = {"task": None}
+        outer_card = ttk.Frame(parent, style="TFrame")
         outer_card.columnconfigure(0, weight=1)
 
         card = ttk.Frame(outer_card, style="Card.TFrame", padding=16)
-        card.grid(row=0, column=0, sticky="ew")
+        card.grid(row=0, column=0, sticky="ew", padx=12, pady=6)
         card.columnconfigure(1, weight=1)
 
-        priority_icons = {
-            "high": "🔴",
-            "medium": "🔵",
-            "low": "🟢",
-            "done": "✓"
-        }
-        color_key = "done" if task.status == "done" else task.priority
-        badge_color = PRIORITY_COLORS.get(color_key, "#999999")
-        icon = priority_icons.get(color_key, "•")
-        badge_text = f"{icon} {task.priority.title()}" if task.status != "done" else f"{icon} Completed"
-        
-        badge = tk.Label(card, 
-            text=badge_text,
-            bg=badge_color, 
-            fg="white", 
-            padx=10, 
-            pady=4, 
-            font=("Segoe UI", 9, "bold"),
-            borderwidth=0,
-            relief="flat"
-        )
+        badge = ttk.Label(card, style="Badge.TLabel")
         badge.grid(row=0, column=0, rowspan=2, sticky="nsw", padx=(0,16))
 
-        title_txt = self._truncate_text(task.title, max_length=40)
-        if task.status == "done":
-            title_txt = "✓ " + title_txt
-        
         title_lbl = ttk.Label(card, 
-            text=title_txt, 
-            font=("Segoe UI", 12, "bold"),
-            foreground=APP_COLORS["text_primary"] if task.status != "done" else APP_COLORS["text_secondary"],
+            font=self._f_ui12b,
             cursor="hand2",
             width=40)
         title_lbl.grid(row=0, column=1, sticky="w")
         
-        title_lbl.bind("<Button-1>", lambda e, t=task: self._show_task_details(t))
+        title_lbl.bind("<Button-1>", lambda e: self._show_task_details(row["task"]))
 
-        desc_txt = task.description if task.description else "(no description)"
-        desc_lbl = ttk.Label(card, text=desc_txt, style="Muted.TLabel")
+        desc_lbl = ttk.Label(card, style="Muted.TLabel")
         desc_lbl.grid(row=1, column=1, sticky="w")
 
-        # Format date and time display with creation time
-        try:
-            created_dt = datetime.fromisoformat(task.created_at)
-            created_display = created_dt.strftime("%Y-%m-%d %I:%M %p")
-            meta = f"Created: {created_display}"
-        except:
-            meta = f"Created: {task.created_at.split('T')[0]}"
-            
-        if task.due_date:
-            meta += f"  •  Due: {task.due_date}"
-        meta_lbl = ttk.Label(card, text=meta, style="Muted.TLabel")
+        meta_lbl = ttk.Label(card, style="Muted.TLabel")
         meta_lbl.grid(row=2, column=1, sticky="w", pady=(6,0))
 
         btn_frame = ttk.Frame(card)
         btn_frame.grid(row=0, column=2, rowspan=3, sticky="e")
 
         edit_btn = ttk.Button(btn_frame, text="📝 Edit", 
-                            command=lambda t=task: self._open_edit_window(t))
+                            command=lambda: self._open_edit_window(row["task"]))
         edit_btn.grid(row=0, column=0, padx=4, pady=2)
 
-        if task.status != "done":
-            done_btn = ttk.Button(btn_frame, text="✓ Done", 
-                                style="Success.TButton",
-                                command=lambda t=task: self._mark_done(t))
-        else:
-            done_btn = ttk.Button(btn_frame, text="🔄 Reopen",
-                                command=lambda t=task: self._undo_done(t))
+        done_btn = ttk.Button(btn_frame, command=lambda: self._toggle_done(row["task"]))
         done_btn.grid(row=0, column=1, padx=4, pady=2)
 
         archive_btn = ttk.Button(btn_frame, text="🗂️ Archive",
                                style="Archive.TButton",
-                               command=lambda t=task: self._archive_task(t))
+                               command=lambda: self._archive_task(row["task"]))
         archive_btn.grid(row=0, column=2, padx=4, pady=2)
 
-        timer_frame = ttk.Frame(btn_frame)
-        timer_frame.grid(row=1, column=0, columnspan=3, pady=(8,0))
-
-        elapsed = task.remaining_seconds if task.remaining_seconds is not None else 0
-        elapsed_lbl = ttk.Label(timer_frame, 
-                              text=f"⏱ {format_duration(elapsed)}",
-                              font=("Segoe UI", 9, "bold"),
+        elapsed_lbl = ttk.Label(btn_frame, 
+                              font=self._f_ui9b,
                               foreground=APP_COLORS["text_secondary"])
-        elapsed_lbl.grid(row=0, column=0, padx=(0,6))
-        self.timer_labels[task.id] = elapsed_lbl
+        elapsed_lbl.grid(row=1, column=0, columnspan=3, pady=(8,0))
+
+        row.update(frame=outer_card, badge=badge, title=title_lbl, desc=desc_lbl,
+                   meta=meta_lbl, done=done_btn, elapsed=elapsed_lbl)
+        return row
+
+    def _bind_task_row(self, row, task: Task):
+        previous = row["task"]
+        if previous is not None and self.timer_labels.get(previous.id) is row["elapsed"]:
+            del self.timer_labels[previous.id]
+        row["task"] = task
+
+        row["elapsed"].configure(text=_elapsed_text(task.remaining_seconds))
+        self.timer_labels[task.id] = row["elapsed"]
+
+        # Rows are rebound on every scroll and list update; leave the card
+        # alone if it already shows this task in the same state
+        shown = (task, task.status, task.priority, task._title_row,
+                 task._desc_row, task._created_row, task.due_date)
+        prev = row.get("shown")
+        if prev == shown:
+            return
+        row["shown"] = shown
 
-        if task.id not in self.timers and task.status != "done":
-            self._start_timer(task)
+        badge_text, badge_style, title_color, done_text, done_style = \
+            _card_view(task.status, task.priority)
+        # Most rebinds are same-state cards (e.g. scrolling through pending
+        # tasks), which keep their badge and done button as they are
+        same_state = prev is not None and prev[1:3] == shown[1:3]
+        if not same_state:
+            row["badge"].configure(text=badge_text, style=badge_style)
 
-    def _show_task_details(self, task: Task):
+        title_txt = task._title_row
+        if task.status == "done":
+            title_txt = "✓ " + title_txt
+        row["title"].configure(text=title_txt, foreground=title_color)
+
+        # Rows have a fixed height, so only the first description line is shown
+        row["desc"].configure(text=task._desc_row)
+
+        meta = f"Created: {task._created_row}"
+
+        if task.due_date:
+            meta += f"  •  Due: {task.due_date}"
+        row["meta"].configure(text=meta)
+
+        if not same_state:
+            row["done"].configure(text=done_text, style=done_style)
+
+    def _unbind_task_row(self, row):
+        """Hidden cards stop receiving timer ticks"""
+        task = row["task"]
+        if task is not None and self.timer_labels.get(task.id) is row["elapsed"]:
+            del self.timer_labels[task.id]
+
+    def _toggle_done(self, task: Task):
+        if task.status != "done":
+            self._mark_done(task)
+        else:
+            self._undo_done(task)
+
+    def _build_task_details(self):
+        """Build the active task details window once; later opens only re-fill it"""
+        from tkinter.scrolledtext import ScrolledText
         modal = tk.Toplevel(self.root)
+        modal.withdraw()
         modal.transient(self.root)
-        modal.grab_set()
-        
-        window_width = 700
-        window_height = 550
-        header_height = 80
-        
-        root_x = self.root.winfo_x()
-        root_y = self.root.winfo_y()
-        root_width = self.root.winfo_width()
-        
-        position_x = root_x + (root_width - window_width) // 2
-        position_y = root_y + header_height
-        
-        modal.geometry(f"{window_width}x{window_height}+{position_x}+{position_y}")
-        
         modal.title("Task Details")
         modal.configure(bg=APP_COLORS["bg_main"])
         modal.resizable(False, False)
+        modal.protocol("WM_DELETE_WINDOW", self._hide_task_details)
 
         container = ttk.Frame(modal, style="Card.TFrame", padding=0)
         container.pack(fill="both", expand=True, padx=20, pady=20)
 
-        header = tk.Frame(container, bg=PRIORITY_COLORS.get("done" if task.status == "done" else task.priority, "#999999"))
+        header = tk.Frame(container)
         header.pack(fill="x")
         
-        header_content = tk.Frame(header, bg=header["bg"])
+        header_content = tk.Frame(header)
         header_content.pack(fill="x", padx=25, pady=20)
 
-        status_frame = tk.Frame(header_content, bg=header["bg"])
-        status_frame.pack(fill="x", pady=(0, 10))
-        
-        status_text = "✨ COMPLETED" if task.status == "done" else f"{task.priority.upper()} PRIORITY"
-        status_label = tk.Label(status_frame,
-            text=status_text,
-            bg=header["bg"],
+        status_label = tk.Label(header_content,
             fg="white",
-            font=("Segoe UI", 11))
-        status_label.pack(side="left")
+            font=self._f_ui11)
+        status_label.pack(anchor="w", pady=(0, 10))
         
         title_label = tk.Label(header_content,
-            text=task.title,
-            bg=header["bg"],
             fg="white",
-            font=("Segoe UI", 24, "bold"),
+            font=self._f_ui24b,
             wraplength=600,
             justify="left")
         title_label.pack(fill="x", anchor="w")
@@ -1270,57 +1729,35 @@ class TodoApp:
         time_frame = ttk.Frame(meta_frame)
         time_frame.pack(side="left")
         
-        if task.id in self.timers:
-            time_status = "⌛ Active"
-            time_color = APP_COLORS["success"]
-        else:
-            time_status = "⏸️ Paused" if task.status != "done" else "✨ Completed"
-            time_color = APP_COLORS["text_secondary"]
-        
-        time_label = ttk.Label(time_frame,
-            text=time_status,
-            font=("Segoe UI", 10, "bold"),
-            foreground=time_color)
+        time_label = ttk.Label(time_frame, font=self._f_ui10b)
         time_label.pack(anchor="w")
         
-        elapsed_label = ttk.Label(time_frame,
-            text=f"Elapsed Time: {format_duration(task.remaining_seconds)}",
-            style="Muted.TLabel")
+        elapsed_label = ttk.Label(time_frame, style="Muted.TLabel")
         elapsed_label.pack(anchor="w")
 
         dates_frame = ttk.Frame(meta_frame)
         dates_frame.pack(side="right")
         
-        created_date = datetime.fromisoformat(task.created_at).strftime("%B %d, %Y at %I:%M %p")
-        created_label = ttk.Label(dates_frame,
-            text=f"📅 Created: {created_date}",
-            style="Muted.TLabel")
+        created_label = ttk.Label(dates_frame, style="Muted.TLabel")
         created_label.pack(anchor="e")
-        
-        if task.due_date:
-            due_label = ttk.Label(dates_frame,
-                text=f"🎯 Due: {task.due_date}",
-                style="Muted.TLabel")
-            due_label.pack(anchor="e")
+        due_label = ttk.Label(dates_frame, style="Muted.TLabel")
 
         desc_frame = ttk.Frame(content)
         desc_frame.pack(fill="both", expand=True, pady=(0, 20))
         
         desc_header = ttk.Label(desc_frame,
             text="📝 Description",
-            font=("Segoe UI", 12, "bold"),
+            font=self._f_ui12b,
             foreground=APP_COLORS["text_primary"])
         desc_header.pack(anchor="w", pady=(0, 10))
         
         desc_text = ScrolledText(desc_frame,
             wrap=tk.WORD,
-            font=("Segoe UI", 10),
+            font=self._f_ui10,
             height=8,
             relief="flat",
             borderwidth=1)
         desc_text.pack(fill="both", expand=True)
-        desc_text.insert("1.0", task.description if task.description else "(No description provided)")
-        desc_text.configure(state="disabled")
 
         btn_frame = ttk.Frame(content)
         btn_frame.pack(fill="x")
@@ -1328,66 +1765,117 @@ class TodoApp:
         edit_btn = ttk.Button(btn_frame,
             text="📝 Edit Task",
             style="Accent.TButton",
-            command=lambda: [modal.destroy(), self._open_edit_window(task)])
+            command=self._edit_from_task_details)
         edit_btn.pack(side="left")
 
         close_btn = ttk.Button(btn_frame,
             text="Close",
-            command=modal.destroy)
+            command=self._hide_task_details)
         close_btn.pack(side="right")
 
+        self._task_details_modal = modal
+        self._task_details_widgets = {
+            "header": (header, header_content, status_label, title_label),
+            "status": status_label, "title": title_label,
+            "time": time_label, "elapsed": elapsed_label,
+            "created": created_label, "due": due_label, "desc": desc_text,
+        }
+        # (header color, description) last written into the window
+        self._task_details_shown = (None, None)
+
+    def _show_task_details(self, task: Task):
+        if self._task_details_modal is None:
+            self._build_task_details()
+        modal = self._task_details_modal
+        w = self._task_details_widgets
+        self._task_details_task = task
+
+        color = PRIORITY_COLORS.get("done" if task.status == "done" else task.priority, "#999999")
+        desc = task.description if task.description else "(No description provided)"
+        shown_color, shown_desc = self._task_details_shown
+        self._task_details_shown = (color, desc)
+        # Re-opening the same or a similar task keeps what is already there;
+        # refilling the Text widget in particular re-lays out all its lines
+        if color != shown_color:
+            for widget in w["header"]:
+                widget.configure(bg=color)
+        status_text = "✨ COMPLETED" if task.status == "done" else f"{PRIO_UPPER.get(task.priority) or task.priority.upper()} PRIORITY"
+        w["status"].configure(text=status_text)
+        w["title"].configure(text=task.title)
+
+        if task.id in self.running_timers:
+            time_status = "⌛ Active"
+            time_color = APP_COLORS["success"]
+        else:
+            time_status = "⏸️ Paused" if task.status != "done" else "✨ Completed"
+            time_color = APP_COLORS["text_secondary"]
+        w["time"].configure(text=time_status, foreground=time_color)
+        w["elapsed"].configure(text=f"Elapsed Time: {format_duration(task.remaining_seconds)}")
+
+        w["created"].configure(text=f"📅 Created: {task._created_long or task.created_at}")
+        if task.due_date:
+            w["due"].configure(text=f"🎯 Due: {task.due_date}")
+            w["due"].pack(anchor="e")
+        else:
+            w["due"].pack_forget()
+
+        if desc != shown_desc:
+            desc_text = w["desc"]
+            desc_text.configure(state="normal")
+            desc_text.delete("1.0", "end")
+            desc_text.insert("1.0", desc)
+            desc_text.configure(state="disabled")
+        else:
+            w["desc"].yview_moveto(0)
+
+        self._place_modal(modal, 700, 550)
+        modal.deiconify()
+        modal.lift()
+        modal.grab_set()
+
+    def _hide_task_details(self):
+        self._task_details_modal.grab_release()
+        self._task_details_modal.withdraw()
+
+    def _edit_from_task_details(self):
+        self._hide_task_details()
+        self._open_edit_window(self._task_details_task)
+
     def _open_add_window(self):
         self._open_task_window()
 
     def _open_edit_window(self, task: Task):
         self._open_task_window(task)
 
-    def _open_task_window(self, task: Task = None):
+    def _build_task_window(self):
+        """Build the add/edit window once; later opens only re-fill it"""
+        from tkinter.scrolledtext import ScrolledText
         win = tk.Toplevel(self.root)
+        win.withdraw()
         win.transient(self.root)
-        win.grab_set()
-        
-        window_width = 700
-        window_height = 600
-        header_height = 80
-        
-        root_x = self.root.winfo_x()
-        root_y = self.root.winfo_y()
-        root_width = self.root.winfo_width()
-        
-        position_x = root_x + (root_width - window_width) // 2
-        position_y = root_y + header_height
-        
-        win.geometry(f"{window_width}x{window_height}+{position_x}+{position_y}")
-        win.title("Add Task" if task is None else "Edit Task")
         win.configure(bg=APP_COLORS["bg_main"])
         win.resizable(True, True)
+        win.protocol("WM_DELETE_WINDOW", self._hide_task_window)
 
         container = ttk.Frame(win, style="Card.TFrame", padding=0)
         container.pack(fill="both", expand=True, padx=20, pady=20)
 
-        is_new = task is None
-        header_color = APP_COLORS["accent"] if is_new else PRIORITY_COLORS.get(task.priority, "#999999")
-        header = tk.Frame(container, bg=header_color)
+        header = tk.Frame(container)
         header.pack(fill="x")
         
-        header_content = tk.Frame(header, bg=header["bg"])
+        header_content = tk.Frame(header)
         header_content.pack(fill="x", padx=25, pady=20)
 
-        title_text = "✨ NEW TASK" if is_new else "📝 EDIT TASK"
         header_label = tk.Label(header_content,
-            text=title_text,
-            bg=header["bg"],
             fg="white",
-            font=("Segoe UI", 11))
+            font=self._f_ui11)
         header_label.pack(anchor="w", pady=(0, 10))
 
-        title_var = tk.StringVar(value=task.title if task else "")
+        title_var = tk.StringVar()
         title_entry = tk.Entry(header_content,
             textvariable=title_var,
-            font=("Segoe UI", 24, "bold"),
+            font=self._f_ui24b,
             fg="white",
-            bg=header_color,
             insertbackground="white",
             relief="flat",
             highlightthickness=0,
@@ -1402,14 +1890,13 @@ class TodoApp:
         
         priority_label = ttk.Label(priority_frame,
             text="🎯 Priority Level",
-            font=("Segoe UI", 12, "bold"),
+            font=self._f_ui12b,
             foreground=APP_COLORS["text_primary"])
         priority_label.pack(side="left")
         
-        prio_var = tk.StringVar(value=task.priority if task else "medium")
-        priority_icons = {"high": "🔴", "medium": "🔵", "low": "🟢"}
+        prio_var = tk.StringVar(value=PRIO_LABELS["medium"])
         prio_menu = ttk.OptionMenu(priority_frame, prio_var, prio_var.get(),
-            *[f"{priority_icons[p]} {p.title()}" for p in ["high", "medium", "low"]])
+            *PRIO_LABELS.values())
         prio_menu.pack(side="left", padx=(10, 0))
 
         due_frame = ttk.Frame(content)
@@ -1417,11 +1904,11 @@ class TodoApp:
         
         due_label = ttk.Label(due_frame,
             text="📅 Due Date",
-            font=("Segoe UI", 12, "bold"),
+            font=self._f_ui12b,
             foreground=APP_COLORS["text_primary"])
         due_label.pack(side="left")
         
-        due_var = tk.StringVar(value=task.due_date if task and task.due_date else "")
+        due_var = tk.StringVar()
         due_entry = ttk.Entry(due_frame, textvariable=due_var)
         due_entry.pack(side="left", padx=(10, 0))
         due_hint = ttk.Label(due_frame,
@@ -1434,109 +1921,178 @@ class TodoApp:
         
         desc_header = ttk.Label(desc_frame,
             text="📝 Description",
-            font=("Segoe UI", 12, "bold"),
+            font=self._f_ui12b,
             foreground=APP_COLORS["text_primary"])
         desc_header.pack(anchor="w", pady=(0, 10))
         
         desc_text = ScrolledText(desc_frame,
             wrap=tk.WORD,
-            font=("Segoe UI", 10),
+            font=self._f_ui10,
             height=12,
             relief="flat",
             borderwidth=1)
         desc_text.pack(fill="both", expand=True)
-        if task and task.description:
-            desc_text.insert("1.0", task.description)
 
         btn_frame = ttk.Frame(content)
         btn_frame.pack(fill="x")
 
+        error_label = ttk.Label(btn_frame, text="", foreground=APP_COLORS["error"])
+        error_label.pack(side="left")
+
         cancel_btn = ttk.Button(btn_frame,
             text="Cancel",
-            command=win.destroy)
+            command=self._hide_task_window)
         cancel_btn.pack(side="right")
 
         save_btn = ttk.Button(btn_frame,
             text="💾 Save Task",
-            style="Accent.TButton")
+            style="Accent.TButton",
+            command=self._on_task_window_save)
         save_btn.pack(side="right", padx=(0, 10))
 
-        def on_save():
-            title_text = title_var.get().strip()
-            if not title_text:
-                messagebox.showwarning("Validation error", "Title is required.")
-                return
-            description = desc_text.get("1.0", "end").strip()
-            prio_full = prio_var.get()
-            prio = prio_full.split()[-1].lower()
-            due = due_var.get().strip() or None
-
-            if task is None:
-                new_id = storage.get_next_id(self.tasks + self.archived_tasks + self.finished_tasks)
-                start_time = datetime.now()
-                new_task = Task(
-                    id=new_id,
-                    title=title_text,
-                    description=description,
-                    status="pending",
-                    priority=prio,
-                    created_at=start_time.isoformat(),
-                    due_date=due,
-                    duration_seconds=0,
-                    remaining_seconds=0,
-                )
-                self.tasks.append(new_task)
-                logging.info(f"Added task {new_task.id}: {new_task.title}")
-            else:
-                task.title = title_text
-                task.description = description
-                task.priority = prio
-                task.due_date = due
-                logging.info(f"Updated task {task.id}")
+        self._task_window = win
+        self._task_window_widgets = {
+            "header": (header, header_content, header_label, title_entry),
+            "label": header_label, "title_entry": title_entry,
+            "title": title_var, "prio": prio_var, "due": due_var, "desc": desc_text,
+            "error": error_label,
+        }
+        self._task_window_color = None  # header color currently applied
+
+    def _prebuild_windows(self):
+        """Build the reusable task windows once startup has settled
 
-            storage.save_tasks(TASKS_PATH, self.tasks)
-            self._render_tasks()
-            win.destroy()
+        The first click on a task or on New Task then only fills them in.
+        """
+        if self._task_window is None:
+            self._build_task_window()
+        if self._task_details_modal is None:
+            self._build_task_details()
 
-        save_btn.config(command=on_save)
+    def _open_task_window(self, task: Task = None):
+        if self._task_window is None:
+            self._build_task_window()
+        win = self._task_window
+        w = self._task_window_widgets
+        self._editing_task = task
+
+        is_new = task is None
+        win.title("Add Task" if is_new else "Edit Task")
+        header_color = APP_COLORS["accent"] if is_new else PRIORITY_COLORS.get(task.priority, "#999999")
+        if header_color != self._task_window_color:
+            self._task_window_color = header_color
+            for widget in w["header"]:
+                widget.configure(bg=header_color)
+        w["label"].configure(text="✨ NEW TASK" if is_new else "📝 EDIT TASK")
+        self._clear_flash(w["error"])
+
+        w["title"].set(task.title if task else "")
+        w["prio"].set(PRIO_LABELS.get(task.priority, task.priority) if task else PRIO_LABELS["medium"])
+        w["due"].set(task.due_date if task and task.due_date else "")
+        desc_text = w["desc"]
+        desc_text.delete("1.0", "end")
+        if task and task.description:
+            desc_text.insert("1.0", task.description)
+
+        self._place_modal(win, 700, 600)
+        win.deiconify()
+        win.lift()
+        win.grab_set()
+        w["title_entry"].focus_set()
+
+    def _hide_task_window(self):
+        self._task_window.grab_release()
+        self._task_window.withdraw()
+
+    def _on_task_window_save(self):
+        w = self._task_window_widgets
+        task = self._editing_task
+        title_text = w["title"].get().strip()
+        if not title_text:
+            self._flash(w["error"], "⚠ Title is required.")
+            w["title_entry"].focus_set()
+            return
+        description = w["desc"].get("1.0", "end").strip()
+        prio_full = w["prio"].get()
+        # Unknown priorities loaded from a file are shown and kept as-is
+        prio = PRIO_MAP.get(prio_full, prio_full)
+        due = w["due"].get().strip() or None
+
+        if task is None:
+            new_id = self._next_id
+            self._next_id += 1
+            start_time = datetime.now()
+            new_task = Task(
+                id=new_id,
+                title=title_text,
+                description=description,
+                status="pending",
+                priority=prio,
+                created_at=start_time.isoformat(),
+                due_date=due,
+                duration_seconds=0,
+                remaining_seconds=0,
+            )
+            _cache_text_keys(new_task)
+            _cache_created(new_task)
+            self._add_active(new_task)
+            self._sync_view(new_task)
+            logging.info(f"Added task {new_task.id}: {new_task.title}")
+        else:
+            task.title = title_text
+            task.description = description
+            self._count_active(task, -1)
+            task.priority = prio
+            self._count_active(task, 1)
+            task.due_date = due
+            _cache_text_keys(task)
+            self._sync_view(task)
+            logging.info(f"Updated task {task.id}")
+
+        self._mark_dirty(TASKS_PATH)
+        self._update_stats()
+        self._hide_task_window()
 
     def _mark_done(self, task: Task):
-        if task.id in self.timers:
+        if task.id in self.running_timers:
             self._stop_timer(task.id)
 
-        self.tasks = [t for t in self.tasks if t.id != task.id]
+        self._remove_active(task)
 
         task.status = "done"
-        task.remaining_seconds = max(0, task.remaining_seconds or 0)
+        task.remaining_seconds = max(0, task.remaining_seconds)
         
         # CRITICAL FIX: Add completion timestamp
         task.completed_at = datetime.now().isoformat()
         
-        self.finished_tasks.append(task)
+        self._finished_by_id[task.id] = task
+        bisect.insort(self.finished_tasks, task, key=_created_key)
 
-        storage.save_tasks(TASKS_PATH, self.tasks)
-        storage.save_tasks(FINISHED_PATH, self.finished_tasks)
+        self._mark_dirty(TASKS_PATH)
+        self._mark_dirty(FINISHED_PATH)
 
-        self._render_tasks()
+        self._sync_view(task)
         self._render_finished()
         self._update_stats()
 
         logging.info(f"Marked done task {task.id}: {task.title} at {task.completed_at}")
 
     def _undo_done(self, task: Task):
-        self.finished_tasks = [t for t in self.finished_tasks if t.id != task.id]
+        if self._finished_by_id.pop(task.id, None) is None:
+            return  # already handled, e.g. a double click
+        _remove_sorted(self.finished_tasks, task, _created_key)
 
         task.status = "pending"
         # Clear completion timestamp when reopening
         task.completed_at = None
         if task.remaining_seconds == 0:
             task.remaining_seconds = task.duration_seconds
-        self.tasks.append(task)
+        self._add_active(task)
 
-        storage.save_tasks(TASKS_PATH, self.tasks)
-        storage.save_tasks(FINISHED_PATH, self.finished_tasks)
+        self._mark_dirty(TASKS_PATH)
+        self._mark_dirty(FINISHED_PATH)
 
-        self._render_tasks()
+        self._sync_view(task)
         self._render_finished()
         self._update_stats()
 
@@ -1546,70 +2102,108 @@ class TodoApp:
         self._archive_task(task)
 
     def _toggle_timer(self, task: Task):
-        if task.id in self.timers:
+        if task.id in self.running_timers:
+            # The card's label already shows the stopped time; a full render
+            # would only rebind every card (and restart shown timers)
             self._stop_timer(task.id)
-            storage.save_tasks(TASKS_PATH, self.tasks)
-            self._render_tasks()
         else:
             if task.status == "done":
-                messagebox.showinfo("Task is done", "This task is already marked done.")
+                self._flash(self.flash_label, "This task is already marked done.")
                 return
             if task.remaining_seconds <= 0:
                 task.remaining_seconds = task.duration_seconds
             self._start_timer(task)
 
     def _start_timer(self, task: Task):
-        def tick():
-            for t in self.tasks:
-                if t.id == task.id:
-                    t.remaining_seconds = int((t.remaining_seconds or 0) + 1)
-                    break
-            lbl = self.timer_labels.get(task.id)
+        if not self.running_timers:
+            self._last_tick = time.monotonic()
+        self.running_timers[task.id] = task
+        if self._tick_after_id is None and not self._minimized:
+            self._schedule_tick()
+        logging.info(f"Started timer for task {task.id}")
+
+    def _advance_timers(self):
+        """Credit the whole seconds since the last advance to every running timer
+
+        Counting from the monotonic clock instead of adding 1 per tick keeps
+        timers accurate when after() callbacks run late, and also covers time
+        spent minimized, when no ticks run at all.
+        """
+        seconds = int(time.monotonic() - self._last_tick)
+        if seconds <= 0:
+            return
+        self._last_tick += seconds
+        # Tasks leave the active list only through _stop_timer, so every
+        # entry here is live and can be updated directly
+        for tid, t in self.running_timers.items():
+            t.remaining_seconds += seconds
+            lbl = self.timer_labels.get(tid)
             if lbl:
-                lbl.config(text=f"⏱ {format_duration(task.remaining_seconds)}")
-            if task.status != "done":
-                after_id = self.root.after(1000, tick)
-                self.timers[task.id] = after_id
+                lbl.config(text=_elapsed_text(t.remaining_seconds))
 
-        after_id = self.root.after(1000, tick)
-        self.timers[task.id] = after_id
-        logging.info(f"Started timer for task {task.id}")
+    def _tick_all(self):
+        """Advance running timers and update their visible labels, once a second"""
+        self._advance_timers()
+        if self.running_timers:
+            self._schedule_tick()
+        else:
+            self._tick_after_id = None
+
+    def _schedule_tick(self):
+        """Run the next tick when the next whole second is due
+
+        Aiming at the second boundary rather than a flat 1000 ms keeps late
+        callbacks from drifting until a tick credits two seconds at once,
+        which shows as a skipped second on every running timer.
+        """
+        due_in = 1.0 - (time.monotonic() - self._last_tick)
+        self._tick_after_id = self.root.after(max(1, int(due_in * 1000) + 1), self._tick_all)
+
+    def _on_root_unmap(self, event):
+        if event.widget is not self.root or self._minimized:
+            return
+        self._minimized = True
+        if self._tick_after_id is not None:
+            self.root.after_cancel(self._tick_after_id)
+            self._tick_after_id = None
+
+    def _on_root_map(self, event):
+        if event.widget is not self.root or not self._minimized:
+            return
+        self._minimized = False
+        if self.running_timers and self._tick_after_id is None:
+            self._tick_all()
 
     def _stop_timer(self, task_id: int):
-        after_id = self.timers.get(task_id)
-        if after_id:
-            try:
-                self.root.after_cancel(after_id)
-            except Exception:
-                pass
-        if task_id in self.timers:
-            del self.timers[task_id]
+        if task_id in self.running_timers:
+            self._advance_timers()
+        self.running_timers.pop(task_id, None)
+        if not self.running_timers and self._tick_after_id is not None:
+            self.root.after_cancel(self._tick_after_id)
+            self._tick_after_id = None
         logging.info(f"Stopped timer for task {task_id}")
-        storage.save_tasks(TASKS_PATH, self.tasks)
+        # Ticks don't save; persist the time the timer ended on
+        self._mark_dirty(TASKS_PATH)
 
     def _reset_timer(self, task: Task):
-        if task.id in self.timers:
+        if task.id in self.running_timers:
             self._stop_timer(task.id)
         task.remaining_seconds = task.duration_seconds
-        storage.save_tasks(TASKS_PATH, self.tasks)
-        self._render_tasks()
+        self._mark_dirty(TASKS_PATH)
+        # Only this task's timer changed: restart it (pending tasks always
+        # run) and refresh its label, instead of re-rendering every card
+        if task.id in self._tasks_by_id and task.status != "done":
+            self._start_timer(task)
+        lbl = self.timer_labels.get(task.id)
+        if lbl:
+            lbl.config(text=_elapsed_text(task.remaining_seconds))
 
 
 def main():
     root = tk.Tk()
-    app = TodoApp(root)
-    root.protocol("WM_DELETE_WINDOW", lambda: on_close(root, app))
+    TodoApp(root)
     root.mainloop()
 
 
-def on_close(root, app: TodoApp):
-    for tid in list(app.timers.keys()):
-        app._stop_timer(tid)
-    storage.save_tasks(TASKS_PATH, app.tasks)
-    storage.save_tasks(ARCHIVE_PATH, app.archived_tasks)
-    storage.save_tasks(FINISHED_PATH, app.finished_tasks)
-    root.destroy()
-
-
 if __name__ == "__main__":
     main()
@@ -1,7 +1,7 @@
 import os
 import json
 import tempfile
-from todo.storage import load_tasks, save_tasks, get_next_id
+from todo.storage import load_tasks, load_partitioned, save_records, save_tasks, get_next_id
 from todo.models import Task
 
 def test_save_and_load(tmp_path):
@@ -23,3 +23,68 @@ def test_get_next_id(tmp_path):
     assert get_next_id([]) == 1
     tlist = [Task(id=5, title="x")]
     assert get_next_id(tlist) == 6
+    assert get_next_id(iter([Task(id=2, title="y"), Task(id=7, title="z")])) == 8
+
+def test_save_is_indented_utf8(tmp_path):
+    p = tmp_path / "tasks.json"
+    task = Task(id=1, title="Café", description="", status="pending",
+                priority="low", created_at="2024-01-01T09:00:00")
+    save_tasks(str(p), [task], pretty=True)
+    raw = p.read_bytes()
+    assert "Café".encode("utf-8") in raw
+    assert b'\n  {\n    "id": 1' in raw
+    assert json.loads(raw)[0]["title"] == "Café"
+
+def test_save_is_compact_by_default(tmp_path):
+    p = tmp_path / "tasks.json"
+    task = Task(id=1, title="Café", description="", status="pending",
+                priority="low", created_at="2024-01-01T09:00:00")
+    save_tasks(str(p), [task])
+    raw = p.read_bytes()
+    assert raw.startswith(b'[{"id":1,"title":"Caf\xc3\xa9",')
+    assert b"\n" not in raw
+    assert load_tasks(str(p))[0].title == "Café"
+
+def test_save_replaces_file_without_leftovers(tmp_path):
+    p = tmp_path / "tasks.json"
+    p.write_text("not json")
+    task = Task(id=3, title="Three", description="", status="pending",
+                priority="low", created_at="2024-01-01T09:00:00")
+    save_tasks(str(p), [task])
+    assert [t.id for t in load_tasks(str(p))] == [3]
+    assert os.listdir(tmp_path) == ["tasks.json"]
+
+def test_load_partitioned(tmp_path):
+    p = tmp_path / "tasks.json"
+    tasks = [
+        Task(id=1, title="One"),
+        Task(id=2, title="Two", status="archived"),
+        Task(id=3, title="Three", status="done"),
+        Task(id=4, title="Four"),
+    ]
+    save_tasks(str(p), tasks)
+    active, stray = load_partitioned(str(p), ("archived", "done"))
+    assert [t.id for t in active] == [1, 4]
+    assert [t.id for t in stray] == [2, 3]
+
+def test_load_missing_file_is_empty(tmp_path):
+    assert load_tasks(str(tmp_path / "missing.json")) == []
+
+def test_archived_at_round_trips(tmp_path):
+    p = tmp_path / "archive.json"
+    task = Task(id=1, title="Old", status="archived",
+                created_at="2024-01-01T09:00:00", archived_at="2024-02-01T10:00:00")
+    save_tasks(str(p), [task])
+    assert "_search_lc" not in json.loads(p.read_bytes())[0]
+    assert load_tasks(str(p))[0].archived_at == "2024-02-01T10:00:00"
+
+def test_save_records_matches_save_tasks(tmp_path):
+    tasks = [Task(id=1, title="One", created_at="2024-01-01T09:00:00")]
+    save_tasks(str(tmp_path / "a.json"), tasks)
+    save_records(str(tmp_path / "b.json"), [t.to_dict() for t in tasks])
+    assert (tmp_path / "a.json").read_bytes() == (tmp_path / "b.json").read_bytes()
+
+def test_save_reports_failure(tmp_path):
+    missing_dir = tmp_path / "missing" / "tasks.json"
+    assert save_tasks(str(missing_dir), [Task(id=1, title="One")]) is False
+    assert save_tasks(str(tmp_path / "tasks.json"), [Task(id=1, title="One")]) is True
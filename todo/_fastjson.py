@@ -0,0 +1,28 @@
+"""JSON encode/decode through orjson when it is installed, stdlib json otherwise.
+
+Both paths work on bytes and produce the same UTF-8 output: compact by
+default, or 2-space indented with ``pretty=True`` when a readable file is
+wanted, whichever backend wrote it.
+"""
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+if orjson is not None:
+    def dumps(obj, pretty=False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+
+    loads = orjson.loads
+else:
+    import json
+
+    def dumps(obj, pretty=False) -> bytes:
+        if pretty:
+            text = json.dumps(obj, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        return text.encode("utf-8")
+
+    def loads(data: bytes):
+        return json.loads(data)
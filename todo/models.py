@@ -1,39 +1,72 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: int
     title: str
-    description: str
-    status: str
-    priority: str
-    created_at: str
+    description: str = ""
+    status: str = "pending"
+    priority: str = "low"
+    created_at: Optional[str] = None
     due_date: Optional[str] = None
     duration_seconds: int = 0
     remaining_seconds: int = 0
     completed_at: Optional[str] = None
+    archived_at: Optional[str] = None
+
+    # Display and sort values the app derives from the fields above; cached
+    # per task, never saved or compared (with slots they must be declared)
+    _search_lc: str = field(default="", init=False, repr=False, compare=False)
+    _title_short: str = field(default="", init=False, repr=False, compare=False)
+    _title_row: str = field(default="", init=False, repr=False, compare=False)
+    _desc_row: str = field(default="", init=False, repr=False, compare=False)
+    _created_ts: float = field(default=0.0, init=False, repr=False, compare=False)
+    _created_row: str = field(default="", init=False, repr=False, compare=False)
+    _created_long: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _archived_ts: float = field(default=0.0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now().isoformat()
+        # Timer fields are plain ints from here on, so the tick can just += 1
+        self.duration_seconds = int(self.duration_seconds or 0)
+        self.remaining_seconds = int(self.remaining_seconds or 0)
 
     def to_dict(self):
-        return asdict(self)
+        # Spelled out rather than asdict(): cheaper per save, and it leaves
+        # out the cached fields below the persisted ones
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status,
+            "priority": self.priority,
+            "created_at": self.created_at,
+            "due_date": self.due_date,
+            "duration_seconds": self.duration_seconds,
+            "remaining_seconds": self.remaining_seconds,
+            "completed_at": self.completed_at,
+            "archived_at": self.archived_at,
+        }
 
     @staticmethod
     def from_dict(d: dict):
         # Provide robust defaults if keys are missing
+        g = d.get
+        duration = g("duration_seconds", 0)
         return Task(
-            id=int(d.get("id", 0)),
-            title=d.get("title", ""),
-            description=d.get("description", ""),
-            status=d.get("status", "pending"),
-            priority=d.get("priority", "low"),
-            created_at=d.get("created_at"),
-            due_date=d.get("due_date"),
-            duration_seconds=int(d.get("duration_seconds", 0)),
-            remaining_seconds=int(d.get("remaining_seconds", d.get("duration_seconds", 0))),
-            completed_at=d.get("completed_at")  # THIS LINE WAS MISSING - THIS IS THE FIX!
+            id=int(g("id", 0)),
+            title=g("title", ""),
+            description=g("description", ""),
+            status=g("status", "pending"),
+            priority=g("priority", "low"),
+            created_at=g("created_at"),
+            due_date=g("due_date"),
+            # __post_init__ turns the timer fields into ints (None -> 0)
+            duration_seconds=duration,
+            remaining_seconds=g("remaining_seconds", duration),
+            completed_at=g("completed_at"),  # THIS LINE WAS MISSING - THIS IS THE FIX!
+            archived_at=g("archived_at"),
         )
@@ -1,37 +1,60 @@
-import json
 import os
-from typing import List
+from typing import Collection, Iterable, List, Tuple
 from todo.models import Task
+from todo._fastjson import dumps, loads
 
 def load_tasks(filepath: str) -> List[Task]:
-    """Load tasks from JSON file"""
-    if not os.path.exists(filepath):
-        return []
-    
+    """Load tasks from JSON file (no file yet means no tasks)"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # Use Task.from_dict which now properly loads completed_at
-            return [Task.from_dict(item) for item in data]
+        # One read of the whole file; decoding happens after it is closed
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        data = loads(raw)
+        # Use Task.from_dict which now properly loads completed_at
+        return [Task.from_dict(item) for item in data]
+    except FileNotFoundError:
+        return []
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
         return []
 
-def save_tasks(filepath: str, tasks: List[Task]) -> None:
-    """Save tasks to JSON file"""
+def load_partitioned(filepath: str, statuses: Collection[str]) -> Tuple[List[Task], List[Task]]:
+    """Load tasks from JSON file, split in one pass into (others, matching)
+
+    matching holds the tasks whose status is in statuses.
+    """
+    others, matching = [], []
+    for task in load_tasks(filepath):
+        (matching if task.status in statuses else others).append(task)
+    return others, matching
+
+def save_tasks(filepath: str, tasks: List[Task], pretty: bool = False) -> bool:
+    """Save tasks to JSON file (compact unless pretty, e.g. for debugging)
+
+    Returns False if the write failed.
+    """
+    # task.to_dict() includes every persisted field, including completed_at
+    return save_records(filepath, [task.to_dict() for task in tasks], pretty)
+
+def save_records(filepath: str, records: List[dict], pretty: bool = False) -> bool:
+    """Save already converted task dicts (e.g. a snapshot taken on another thread)"""
     try:
-        # Use task.to_dict() which uses asdict() and includes all fields including completed_at
-        data = [task.to_dict() for task in tasks]
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Write a sibling temp file and swap it in, so a crash mid-write
+        # never leaves a truncated task file behind; fsync first so the
+        # rename can't land before the data does
+        tmp_path = filepath + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(dumps(records, pretty))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
             
     except Exception as e:
         print(f"Error saving {filepath}: {e}")
+        return False
+    return True
 
-def get_next_id(tasks: List[Task]) -> int:
-    """Get the next available task ID"""
-    if not tasks:
-        return 1
-    return max(task.id for task in tasks) + 1
+def get_next_id(tasks: Iterable[Task]) -> int:
+    """Get the next available task ID (any iterable, e.g. several lists chained)"""
+    return max((task.id for task in tasks), default=0) + 1
 